@@ -1,61 +1,143 @@
 import time
 import tracemalloc
+from array import array
 from collections import deque
+from itertools import combinations
+
+from state_search import bfs, pack_state, unpack_state
+
+ITEMS = ('wolf', 'goat', 'cabbage')
+FORBIDDEN = [(0, 1), (1, 2)]  # (loup, chèvre) et (chèvre, chou) ne restent pas seuls
+
+# Famille de problèmes de traversée : le fermier (bit 0) et num_items
+# éléments (bits 1..num_items) ; un bit à 1 signifie « rive droite ». Le
+# bateau emmène le fermier et au plus boat_capacity éléments de sa rive.
+# Une rive sans le fermier ne doit contenir aucune paire interdite.
+def river_crossing(num_items, boat_capacity, forbidden):
+    items_mask = (1 << num_items) - 1
+    pair_masks = [(1 << a) | (1 << b) for a, b in forbidden]
+    start = 0
+    goal = (1 << (num_items + 1)) - 1
+
+    def is_valid(state):
+        right = state >> 1
+        unattended = (~right & items_mask) if state & 1 else right
+        return all(unattended & mask != mask for mask in pair_masks)
+
+    def successors(state):
+        # Seule la rive quittée par le fermier peut devenir invalide
+        right = state >> 1
+        on_side = right if state & 1 else ~right & items_mask
+        bits = [1 << i for i in range(num_items) if (on_side >> i) & 1]
+        next_states = []
+        for k in range(min(boat_capacity, len(bits)) + 1):
+            for cargo in combinations(bits, k):
+                moved = sum(cargo)
+                left_behind = on_side ^ moved
+                if all(left_behind & mask != mask for mask in pair_masks):
+                    next_states.append(state ^ 1 ^ (moved << 1))
+        return next_states
+
+    return start, goal, successors, is_valid
+
+UNREACHABLE = 0xFFFF
+
+# Table précalculée d'un problème de traversée : tous les états valides,
+# leurs successeurs (format CSR : targets[offsets[i]:offsets[i + 1]]) et
+# la matrice des distances entre toutes les paires d'états (un BFS depuis
+# chaque état). Une requête départ/arrivée devient une lecture de table.
+class CrossingTable:
+    def __init__(self, num_items, boat_capacity, forbidden):
+        build_start = time.perf_counter()
+        _, _, successors, is_valid = river_crossing(num_items, boat_capacity, forbidden)
+        self.num_items = num_items
+        self.states = array('I', (code for code in range(1 << (num_items + 1)) if is_valid(code)))
+        self.index = {code: i for i, code in enumerate(self.states)}
+        self.offsets = array('I', [0])
+        self.targets = array('I')
+        for code in self.states:
+            self.targets.extend(self.index[next_code] for next_code in successors(code))
+            self.offsets.append(len(self.targets))
+        n = len(self.states)
+        self.distances = array('H', [UNREACHABLE]) * (n * n)
+        for source in range(n):
+            row = source * n
+            self.distances[row + source] = 0
+            queue = deque([source])
+            while queue:
+                u = queue.popleft()
+                d = self.distances[row + u] + 1
+                for i in range(self.offsets[u], self.offsets[u + 1]):
+                    v = self.targets[i]
+                    if self.distances[row + v] == UNREACHABLE:
+                        self.distances[row + v] = d
+                        queue.append(v)
+        self.build_time = time.perf_counter() - build_start
+
+    def nbytes(self):
+        return sum(len(a) * a.itemsize for a in (self.states, self.offsets, self.targets, self.distances))
+
+    # Nombre de traversées de start à goal (états encodés), ou None
+    def distance(self, start, goal):
+        n = len(self.states)
+        d = self.distances[self.index[start] * n + self.index[goal]]
+        return None if d == UNREACHABLE else d
+
+    # Chemin le plus court : à chaque pas, un successeur plus proche de goal d'une traversée
+    def path(self, start, goal):
+        n = len(self.states)
+        u, g = self.index[start], self.index[goal]
+        if self.distances[u * n + g] == UNREACHABLE:
+            return None
+        path = [start]
+        while u != g:
+            remaining = self.distances[u * n + g]
+            for i in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[i]
+                if self.distances[v * n + g] == remaining - 1:
+                    u = v
+                    break
+            path.append(self.states[u])
+        return path
+
+def report_crossing_table(table):
+    print(f"{table.num_items} items: {len(table.states)} states, {len(table.targets)} moves, "
+          f"built in {table.build_time:.3f} seconds, {table.nbytes() / 1024:.1f} KB")
+
+start_code, goal_code, next_codes, valid_code = river_crossing(len(ITEMS), 1, FORBIDDEN)
 
 def is_valid_state(state):
-    # Vérifie si l'état est valide (pas de consommation)
-    farmer, wolf, goat, cabbage = state
-    if farmer == 0:  # Fermier absent
-        if wolf == goat == 1 or goat == cabbage == 1:
-            return False
-    return True
+    # Vérifie si l'état est valide (pas de consommation sur la rive sans fermier)
+    return valid_code(pack_state(state))
 
 def get_next_states(state):
     # Génère les états suivants possibles
-    farmer, wolf, goat, cabbage = state
-    next_states = []
-    moves = [(1, 0, 0, 0), (1, 1, 0, 0), (1, 0, 1, 0), (1, 0, 0, 1)]  # Fermier seul ou avec un élément
-    for move in moves:
-        new_state = tuple((s + m) % 2 for s, m in zip(state, move))  # Change de côté (0->1 ou 1->0)
-        if is_valid_state(new_state):
-            next_states.append(new_state)
-    return next_states
+    return [unpack_state(code, len(state)) for code in next_codes(pack_state(state))]
 
 def solve_farmer():
-    start_state = (0, 0, 0, 0)  # Tout sur la rive gauche
-    goal_state = (1, 1, 1, 1)   # Tout sur la rive droite
-    queue = deque([(start_state, [])])
-    visited = {start_state}
-    
     # Mesure du temps et de la mémoire
     tracemalloc.start()
     start_time = time.time()
-    while queue:
-        state, path = queue.popleft()
-        if state == goal_state:
-            end_time = time.time()
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            path = path + [state]
-            # Affichage des résultats
-            print("\nFarmer, Wolf, Goat, Cabbage Problem:")
-            print(f"Solution Path (states): {path}")
-            print(f"Path Length: {len(path)} steps")
-            print(f"Execution Time: {end_time - start_time:.6f} seconds")
-            print(f"Memory Usage: {peak / 1024:.2f} KB")
-            return path
-        for next_state in get_next_states(state):
-            if next_state not in visited:
-                visited.add(next_state)
-                queue.append((next_state, path + [state]))
+    path, _, _, _ = bfs(start_code, next_codes, lambda code: code == goal_code)
     end_time = time.time()
     current, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
     print("\nFarmer, Wolf, Goat, Cabbage Problem:")
-    print("No solution found.")
+    if path is None:
+        print("No solution found.")
+        print(f"Execution Time: {end_time - start_time:.6f} seconds")
+        print(f"Memory Usage: {peak / 1024:.2f} KB")
+        return []
+    path = [unpack_state(code, len(ITEMS) + 1) for code in path]
+    # Affichage des résultats
+    print(f"Solution Path (states): {path}")
+    print(f"Path Length: {len(path)} steps")
     print(f"Execution Time: {end_time - start_time:.6f} seconds")
     print(f"Memory Usage: {peak / 1024:.2f} KB")
-    return []
+    return path
 
 if __name__ == "__main__":
-    solve_farmer()
\ No newline at end of file
+    solve_farmer()
+    print("\nPrecomputed crossing tables:")
+    for num_items, boat_capacity in [(len(ITEMS), 1), (6, 2), (8, 2)]:
+        report_crossing_table(CrossingTable(num_items, boat_capacity, FORBIDDEN))
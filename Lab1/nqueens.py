@@ -1,55 +1,202 @@
+import os
 import time
 import tracemalloc
+from multiprocessing import Pool
 
-def is_safe(board, row, col, n):
-    # Check if a queen can be placed at position (row, col)
-    for i in range(col):
-        if board[row][i] == 1:
-            return False
-    for i, j in zip(range(row, -1, -1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    for i, j in zip(range(row, n, 1), range(col, -1, -1)):
-        if board[i][j] == 1:
-            return False
-    return True
-
-def solve_4queens_util(board, col, n, solutions):
-    # Recursive function to solve the problem using backtracking
-    if col >= n:
-        # A valid solution is found
-        solution = []
-        for i in range(n):
-            for j in range(n):
-                if board[i][j] == 1:
-                    solution.append((i, j))
-        solutions.append(solution)
-        return True
-    for i in range(n):
-        if is_safe(board, i, col, n):
-            board[i][col] = 1
-            solve_4queens_util(board, col + 1, n, solutions)
-            board[i][col] = 0  # Backtrack
-    return False
+# Bitboard backtracking: columns are filled left to right and the rows
+# attacked by earlier queens are kept as three integer masks (same row,
+# rising diagonal, falling diagonal). Mirroring a board top to bottom gives
+# another solution, so the first queen only tries the top half of the rows
+# and each solution found there also stands for its mirror.
+def first_column_passes(n):
+    passes = [((1 << (n // 2)) - 1, True)]  # (first queen rows, mirror)
+    if n % 2:
+        passes.append((1 << (n // 2), False))  # middle row is its own mirror
+    return passes
+
+def count_nqueens(n):
+    if n == 0:
+        return 1  # the empty board
+    full = (1 << n) - 1
+    total = 0
+    for first, mirror in first_column_passes(n):
+        count = 0
+        free = [0] * n
+        rows = [0] * n
+        up = [0] * n
+        down = [0] * n
+        free[0] = first
+        col = 0
+        while col >= 0:
+            f = free[col]
+            if not f:
+                col -= 1
+                continue
+            bit = f & -f
+            free[col] = f ^ bit
+            if col == n - 1:
+                count += 1
+                continue
+            r = rows[col] | bit
+            u = ((up[col] | bit) << 1) & full
+            d = (down[col] | bit) >> 1
+            col += 1
+            rows[col], up[col], down[col] = r, u, d
+            free[col] = full & ~(r | u | d)
+        total += 2 * count if mirror else count
+    return total
+
+# Stream solutions one at a time, each as a list of (row, col) positions
+# sorted by row
+def iter_nqueens(n):
+    if n == 0:
+        yield []
+        return
+    full = (1 << n) - 1
+    for first, mirror in first_column_passes(n):
+        free = [0] * n
+        rows = [0] * n
+        up = [0] * n
+        down = [0] * n
+        placed = [0] * n
+        free[0] = first
+        col = 0
+        while col >= 0:
+            f = free[col]
+            if not f:
+                col -= 1
+                continue
+            bit = f & -f
+            free[col] = f ^ bit
+            placed[col] = bit.bit_length() - 1
+            if col == n - 1:
+                col_of_row = [0] * n
+                for c, row in enumerate(placed):
+                    col_of_row[row] = c
+                yield [(row, c) for row, c in enumerate(col_of_row)]
+                if mirror:
+                    yield [(row, c) for row, c in enumerate(reversed(col_of_row))]
+                continue
+            r = rows[col] | bit
+            u = ((up[col] | bit) << 1) & full
+            d = (down[col] | bit) >> 1
+            col += 1
+            rows[col], up[col], down[col] = r, u, d
+            free[col] = full & ~(r | u | d)
+
+# Split the search tree after the first depth columns into independent
+# subproblems: (rows of the queens placed so far, masks, mirror weight)
+def split_nqueens(n, depth):
+    if n == 0:
+        return [((), 0, 0, 0, 1)]
+    full = (1 << n) - 1
+    depth = max(1, min(depth, n))
+    subproblems = []
+    def expand(placed, rows, up, down, free, weight):
+        while free:
+            bit = free & -free
+            free ^= bit
+            r = rows | bit
+            u = ((up | bit) << 1) & full
+            d = (down | bit) >> 1
+            if len(placed) + 1 == depth:
+                subproblems.append((placed + (bit.bit_length() - 1,), r, u, d, weight))
+            else:
+                expand(placed + (bit.bit_length() - 1,), r, u, d, full & ~(r | u | d), weight)
+    for first, mirror in first_column_passes(n):
+        expand((), 0, 0, 0, first, 2 if mirror else 1)
+    return subproblems
+
+# Solve one subproblem; runs in a worker process
+def solve_subproblem(args):
+    n, (placed, rows, up, down, weight), collect = args
+    start_time = time.perf_counter()
+    full = (1 << n) - 1
+    depth = len(placed)
+    count = 0
+    nodes = 0
+    solutions = [] if collect else None
+    cols = list(placed) + [0] * (n - depth)
+    free = [0] * (n + 1)
+    row_masks = [0] * (n + 1)
+    up_masks = [0] * (n + 1)
+    down_masks = [0] * (n + 1)
+    row_masks[depth], up_masks[depth], down_masks[depth] = rows, up, down
+    free[depth] = full & ~(rows | up | down)
+    col = depth
+    while col >= depth:
+        if col == n:
+            count += 1
+            if collect:
+                col_of_row = [0] * n
+                for c, row in enumerate(cols):
+                    col_of_row[row] = c
+                solutions.append([(row, c) for row, c in enumerate(col_of_row)])
+                if weight == 2:
+                    solutions.append([(row, c) for row, c in enumerate(reversed(col_of_row))])
+            col -= 1
+            continue
+        f = free[col]
+        if not f:
+            col -= 1
+            continue
+        nodes += 1
+        bit = f & -f
+        free[col] = f ^ bit
+        cols[col] = bit.bit_length() - 1
+        r = row_masks[col] | bit
+        u = ((up_masks[col] | bit) << 1) & full
+        d = (down_masks[col] | bit) >> 1
+        col += 1
+        row_masks[col], up_masks[col], down_masks[col] = r, u, d
+        free[col] = full & ~(r | u | d)
+    return {'worker': os.getpid(), 'count': count * weight, 'nodes': nodes,
+            'time': time.perf_counter() - start_time, 'solutions': solutions}
+
+# Run the subproblems on a process pool. Workers pull one subproblem at a
+# time from the shared queue, so a worker that finishes early takes the
+# next pending subproblem instead of idling; results arrive as they finish.
+def run_subproblems(n, prefix_depth=3, workers=None, collect=False):
+    tasks = [(n, subproblem, collect) for subproblem in split_nqueens(n, prefix_depth)]
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(solve_subproblem, tasks, chunksize=1)
+
+# Count all solutions in parallel; also returns, for every worker, the
+# subproblems it solved, the nodes it expanded and the time it spent
+def parallel_count_nqueens(n, prefix_depth=3, workers=None):
+    total = 0
+    stats = {}
+    for result in run_subproblems(n, prefix_depth, workers):
+        total += result['count']
+        worker = stats.setdefault(result['worker'], {'tasks': 0, 'nodes': 0, 'time': 0.0})
+        worker['tasks'] += 1
+        worker['nodes'] += result['nodes']
+        worker['time'] += result['time']
+    for worker in stats.values():
+        worker['nodes_per_second'] = worker['nodes'] / worker['time'] if worker['time'] else 0.0
+    return total, stats
+
+# Stream all solutions, enumerated in parallel, in order of completion
+def parallel_iter_nqueens(n, prefix_depth=3, workers=None):
+    for result in run_subproblems(n, prefix_depth, workers, collect=True):
+        yield from result['solutions']
 
 def solve_4queens():
     n = 10
-    board = [[0] * n for _ in range(n)]
-    solutions = []
     # Measure time and memory
     tracemalloc.start()
     start_time = time.time()
-    solve_4queens_util(board, 0, n, solutions)  # Corrected: removed 'hearing'
+    count = count_nqueens(n)
     end_time = time.time()
     current, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
-    # Display results
+    # Display results, streaming the solutions instead of storing them
     print("4 Queens Problem:")
-    print(f"Solutions found: {len(solutions)}")
-    for idx, sol in enumerate(solutions, 1):
+    print(f"Solutions found: {count}")
+    for idx, sol in enumerate(iter_nqueens(n), 1):
         print(f"Solution {idx}: {sol}")
     print(f"Execution Time: {end_time - start_time:.6f} seconds")
     print(f"Memory Usage: {peak / 1024:.2f} KB")
 
 if __name__ == "__main__":
-    solve_4queens()
\ No newline at end of file
+    solve_4queens()
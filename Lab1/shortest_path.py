@@ -1,8 +1,16 @@
+import mmap
+import struct
+import sys
 import time
 import tracemalloc
 import heapq
+from array import array
+from collections import OrderedDict
+from multiprocessing import Pool
 
-def dijkstra(graph, start, end):
+# hooks (voir search_hooks.py à la racine du dépôt) reçoit les événements
+# expand (taille de la file), generate (distance) et prune (entrée périmée)
+def dijkstra(graph, start, end, hooks=None):
     # Algorithme de Dijkstra pour le chemin le plus court
     distances = {node: float('infinity') for node in graph}
     distances[start] = 0
@@ -14,13 +22,19 @@ def dijkstra(graph, start, end):
         if current_node == end:
             break
         if current_distance > distances[current_node]:
+            if hooks is not None:
+                hooks.emit('prune', current_distance)
             continue
+        if hooks is not None:
+            hooks.emit('expand', len(pq))
         for neighbor, weight in graph[current_node].items():
             distance = current_distance + weight
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
                 previous[neighbor] = current_node
                 heapq.heappush(pq, (distance, neighbor))
+                if hooks is not None:
+                    hooks.emit('generate', distance)
     
     # Reconstruire le chemin
     path = []
@@ -31,20 +45,686 @@ def dijkstra(graph, start, end):
     path.reverse()
     return path, distances[end]
 
-def solve_shortest_path():
-    # Graphe exemple (nœuds A, B, C, D, E)
-    graph = {
-        'A': {'B': 4, 'C': 2},
-        'B': {'A': 4, 'C': 1, 'D': 5},
-        'C': {'A': 2, 'B': 1, 'D': 8, 'E': 10},
-        'D': {'B': 5, 'C': 8, 'E': 2},
-        'E': {'C': 10, 'D': 2}
-    }
-    start, end = 'A', 'E'
+# Graphe au format CSR (compressed sparse row) : les voisins du nœud u sont
+# targets[offsets[u]:offsets[u + 1]], avec les poids correspondants dans
+# weights. Les nœuds sont des entiers 0..n-1 ; names/index font la
+# correspondance avec les étiquettes d'origine quand il y en a.
+class CSRGraph:
+    def __init__(self, offsets, targets, weights, names=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)} if names is not None else None
+        self.reversed_graph = None
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def node_id(self, node):
+        return self.index[node] if self.index is not None else node
+
+    def node_name(self, u):
+        return self.names[u] if self.names is not None else u
+
+    # Graphe transposé (arcs inversés), construit une seule fois
+    def reverse(self):
+        if self.reversed_graph is None:
+            sources = array('i')
+            for u in range(self.num_nodes):
+                sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+            self.reversed_graph = CSRGraph.from_edges(self.num_nodes, self.targets, sources, self.weights, self.names)
+            self.reversed_graph.reversed_graph = self
+        return self.reversed_graph
+
+    # Construit le CSR à partir de listes d'arcs par un tri par comptage
+    @classmethod
+    def from_edges(cls, num_nodes, sources, targets, weights, names=None):
+        counts = array('q', bytes(8 * (num_nodes + 1)))
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(num_nodes):
+            counts[u + 1] += counts[u]
+        offsets = array('q', counts)
+        csr_targets = array('i', bytes(4 * len(targets)))
+        csr_weights = array('d', bytes(8 * len(weights)))
+        for u, v, w in zip(sources, targets, weights):
+            pos = counts[u]
+            csr_targets[pos] = v
+            csr_weights[pos] = w
+            counts[u] = pos + 1
+        return cls(offsets, csr_targets, csr_weights, names)
+
+    # Conversion depuis le format dict de dicts utilisé par dijkstra
+    @classmethod
+    def from_dict(cls, graph):
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+        sources, targets, weights = array('i'), array('i'), array('d')
+        for node, neighbors in graph.items():
+            for neighbor, weight in neighbors.items():
+                sources.append(index[node])
+                targets.append(index[neighbor])
+                weights.append(weight)
+        return cls.from_edges(len(names), sources, targets, weights, names)
+
+# Chargement en flux d'un fichier de liste d'arcs "u v [poids]" (une arête
+# par ligne, lignes vides ou commençant par # ou % ignorées). Avec
+# numeric=True les nœuds sont des entiers 0..n-1 et aucun dictionnaire
+# d'étiquettes n'est construit. Les arcs sont accumulés dans des tableaux
+# compacts, jamais dans des objets Python par nœud.
+def load_edge_list(path, directed=True, numeric=True):
+    sources, targets, weights = array('i'), array('i'), array('d')
+    index = {}
+    num_nodes = 0
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0][0] in '#%':
+                continue
+            if numeric:
+                u, v = int(parts[0]), int(parts[1])
+                num_nodes = max(num_nodes, u + 1, v + 1)
+            else:
+                u = index.setdefault(parts[0], len(index))
+                v = index.setdefault(parts[1], len(index))
+            w = float(parts[2]) if len(parts) > 2 else 1.0
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+            if not directed:
+                sources.append(v)
+                targets.append(u)
+                weights.append(w)
+    names = None if numeric else list(index)
+    if not numeric:
+        num_nodes = len(names)
+    return CSRGraph.from_edges(num_nodes, sources, targets, weights, names)
+
+INFINITY = float('infinity')
+
+# État d'une recherche (distances, prédécesseurs) préalloué une fois pour
+# toutes. Une requête ne remet rien à zéro : elle incrémente epoch, et une
+# case dont stamp ne vaut pas epoch est considérée comme jamais atteinte.
+class SearchSide:
+    def __init__(self, num_nodes):
+        self.distances = array('d', [INFINITY]) * num_nodes
+        self.previous = array('i', [-1]) * num_nodes
+        self.stamp = array('I', [0]) * num_nodes
+        self.epoch = 0
+
+    def reset(self):
+        self.epoch += 1
+        if self.epoch == 2**32:  # débordement du compteur : vraie remise à zéro
+            self.stamp = array('I', [0]) * len(self.stamp)
+            self.epoch = 1
+
+    def distance(self, u):
+        return self.distances[u] if self.stamp[u] == self.epoch else INFINITY
+
+    def update(self, u, distance, previous):
+        self.distances[u] = distance
+        self.previous[u] = previous
+        self.stamp[u] = self.epoch
+
+    def predecessor(self, u):
+        return self.previous[u] if self.stamp[u] == self.epoch else -1
+
+# Espace de travail réutilisable entre requêtes sur un même graphe : un côté
+# avant et un côté arrière (pour la recherche bidirectionnelle)
+class QueryWorkspace:
+    def __init__(self, graph):
+        self.graph = graph
+        self.forward = SearchSide(graph.num_nodes)
+        self.backward = SearchSide(graph.num_nodes)
+
+def build_path(graph, side, target):
+    path = []
+    u = target
+    while u != -1:
+        path.append(graph.node_name(u))
+        u = side.predecessor(u)
+    path.reverse()
+    return path
+
+# Dijkstra directement sur un CSRGraph ; même résultat (chemin, distance)
+# que dijkstra. heuristic(u, target), si fournie, doit être une borne
+# inférieure de la distance restante : la recherche devient alors A*.
+# hooks : mêmes événements que dijkstra, et mesure du temps de heuristic.
+def dijkstra_csr(graph, start, end, workspace=None, heuristic=None, hooks=None):
+    if hooks is not None and heuristic:
+        heuristic = hooks.timed('heuristic', heuristic)
+    source, target = graph.node_id(start), graph.node_id(end)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    side = (workspace or QueryWorkspace(graph)).forward
+    side.reset()
+    side.update(source, 0, -1)
+    distances, previous, stamp, epoch = side.distances, side.previous, side.stamp, side.epoch
+    pq = [(heuristic(source, target) if heuristic else 0, 0, source)]
+
+    while pq:
+        _, current_distance, u = heapq.heappop(pq)
+        if u == target:
+            break
+        if current_distance > distances[u]:
+            if hooks is not None:
+                hooks.emit('prune', current_distance)
+            continue
+        if hooks is not None:
+            hooks.emit('expand', len(pq))
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = current_distance + weights[i]
+            if stamp[v] != epoch or distance < distances[v]:
+                distances[v] = distance
+                previous[v] = u
+                stamp[v] = epoch
+                heapq.heappush(pq, (distance + heuristic(v, target) if heuristic else distance, distance, v))
+                if hooks is not None:
+                    hooks.emit('generate', distance)
+
+    return build_path(graph, side, target), side.distance(target)
+
+def astar_csr(graph, start, end, heuristic, workspace=None, hooks=None):
+    return dijkstra_csr(graph, start, end, workspace, heuristic, hooks)
+
+# Dijkstra bidirectionnel : une recherche depuis le départ sur le graphe,
+# une depuis l'arrivée sur le graphe transposé, en alternant. On s'arrête
+# quand la somme des deux minimums de file dépasse le meilleur chemin vu.
+def bidirectional_dijkstra(graph, start, end, workspace=None):
+    source, target = graph.node_id(start), graph.node_id(end)
+    workspace = workspace or QueryWorkspace(graph)
+    sides = [(graph, workspace.forward), (graph.reverse(), workspace.backward)]
+    queues = [[(0, source)], [(0, target)]]
+    sides[0][1].reset()
+    sides[1][1].reset()
+    sides[0][1].update(source, 0, -1)
+    sides[1][1].update(target, 0, -1)
+    best, meeting = (0, source) if source == target else (INFINITY, -1)
+
+    while queues[0] and queues[1] and queues[0][0][0] + queues[1][0][0] < best:
+        direction = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        (g, side), other = sides[direction], sides[1 - direction][1]
+        queue = queues[direction]
+        current_distance, u = heapq.heappop(queue)
+        distances, previous, stamp, epoch = side.distances, side.previous, side.stamp, side.epoch
+        if current_distance > distances[u]:
+            continue
+        other_distances, other_stamp, other_epoch = other.distances, other.stamp, other.epoch
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            distance = current_distance + weights[i]
+            if stamp[v] != epoch or distance < distances[v]:
+                distances[v] = distance
+                previous[v] = u
+                stamp[v] = epoch
+                heapq.heappush(queue, (distance, v))
+                # Un chemin par v ne peut changer que si une des deux
+                # distances de v baisse : on ne le teste qu'à ce moment
+                if other_stamp[v] == other_epoch and distance + other_distances[v] < best:
+                    best, meeting = distance + other_distances[v], v
+
+    if meeting == -1:
+        return [graph.node_name(target)], INFINITY
+    path = build_path(graph, workspace.forward, meeting)
+    u = workspace.backward.predecessor(meeting)
+    while u != -1:
+        path.append(graph.node_name(u))
+        u = workspace.backward.predecessor(u)
+    return path, best
+
+# Arbre des plus courts chemins depuis source : tableaux des distances et
+# des prédécesseurs pour tous les nœuds (sur le graphe transposé, ce sont
+# les distances de tous les nœuds vers source)
+def shortest_path_tree(graph, source):
+    side = SearchSide(graph.num_nodes)
+    pq = [(0, source)]
+    side.update(source, 0, -1)
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+        if current_distance > side.distances[u]:
+            continue
+        for i in range(graph.offsets[u], graph.offsets[u + 1]):
+            v = graph.targets[i]
+            distance = current_distance + graph.weights[i]
+            if distance < side.distances[v]:
+                side.update(v, distance, u)
+                heapq.heappush(pq, (distance, v))
+    return side.distances, side.previous
+
+def single_source_distances(graph, source):
+    return shortest_path_tree(graph, source)[0]
+
+# Heuristique ALT (A*, landmarks, inégalité triangulaire). Les repères sont
+# choisis par « point le plus éloigné » : chacun est le nœud le plus loin
+# des repères déjà pris. Pour chaque repère L on garde d(L, u) et d(u, L) :
+# d(L, t) - d(L, u) et d(u, L) - d(t, L) minorent d(u, t). Sur un graphe
+# orienté, seules ces différences dans un sens sont des minorants, pas leur
+# valeur absolue.
+def landmark_heuristic(graph, num_landmarks=4, landmarks=None):
+    reverse = graph.reverse()
+    if landmarks is None:
+        landmarks = [0]
+        closest = single_source_distances(graph, 0)
+        while len(landmarks) < min(num_landmarks, graph.num_nodes):
+            reachable = [u for u in range(graph.num_nodes) if closest[u] < INFINITY and u not in landmarks]
+            if not reachable:
+                break
+            landmark = max(reachable, key=closest.__getitem__)
+            landmarks.append(landmark)
+            closest = array('d', map(min, closest, single_source_distances(graph, landmark)))
+    else:
+        landmarks = [graph.node_id(landmark) for landmark in landmarks]
+    from_landmark = [single_source_distances(graph, landmark) for landmark in landmarks]
+    to_landmark = [single_source_distances(reverse, landmark) for landmark in landmarks]
+
+    def heuristic(u, target):
+        bound = 0
+        for d_from, d_to in zip(from_landmark, to_landmark):
+            if d_from[target] < INFINITY and d_from[u] < INFINITY:
+                bound = max(bound, d_from[target] - d_from[u])
+            if d_to[u] < INFINITY and d_to[target] < INFINITY:
+                bound = max(bound, d_to[u] - d_to[target])
+        return bound
+
+    return heuristic
+
+# Cache LRU de taille bornée pour un graphe statique : paires déjà
+# résolues et arbres de plus courts chemins (beaucoup plus gros, donc
+# bornés séparément). Un cache ne doit servir qu'à un seul graphe.
+class ShortestPathCache:
+    def __init__(self, max_pairs=100000, max_trees=8):
+        self.max_pairs = max_pairs
+        self.max_trees = max_trees
+        self.pairs = OrderedDict()
+        self.trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, store, key):
+        if key in store:
+            store.move_to_end(key)
+            self.hits += 1
+            return store[key]
+        self.misses += 1
+        return None
+
+    def store(self, store, key, value, limit):
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def get_pair(self, source, target):
+        return self.lookup(self.pairs, (source, target))
+
+    def put_pair(self, source, target, result):
+        self.store(self.pairs, (source, target), result, self.max_pairs)
+
+    def get_tree(self, source):
+        return self.lookup(self.trees, source)
+
+    def put_tree(self, source, tree):
+        self.store(self.trees, source, tree, self.max_trees)
+
+def path_from_tree(graph, tree, target):
+    distances, previous = tree
+    path = []
+    u = target
+    while u != -1:
+        path.append(graph.node_name(u))
+        u = previous[u]
+    path.reverse()
+    return path, distances[target]
+
+# Graphe des processus de calcul, transmis une seule fois par processus
+worker_graph = None
+
+def init_worker(graph):
+    global worker_graph
+    worker_graph = graph
+
+def worker_tree(source):
+    return source, shortest_path_tree(worker_graph, source)
+
+# Requêtes plusieurs-à-plusieurs : les paires sont regroupées par départ et
+# un seul arbre de plus courts chemins répond à toutes les arrivées d'un
+# même départ. Les départs indépendants sont calculés par un pool de
+# processus. Renvoie les (chemin, distance) dans l'ordre des paires.
+def batch_shortest_paths(graph, pairs, workers=1, cache=None):
+    results = [None] * len(pairs)
+    by_source = {}
+    for i, (start, end) in enumerate(pairs):
+        source, target = graph.node_id(start), graph.node_id(end)
+        cached = cache.get_pair(source, target) if cache is not None else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            by_source.setdefault(source, []).append((i, target))
+
+    def answer(source, tree):
+        if cache is not None:
+            cache.put_tree(source, tree)
+        for i, target in by_source[source]:
+            results[i] = path_from_tree(graph, tree, target)
+            if cache is not None:
+                cache.put_pair(source, target, results[i])
+
+    pending = []
+    for source in by_source:
+        tree = cache.get_tree(source) if cache is not None else None
+        if tree is not None:
+            answer(source, tree)
+        else:
+            pending.append(source)
+
+    if workers == 1 or len(pending) < 2:
+        for source in pending:
+            answer(source, shortest_path_tree(graph, source))
+    else:
+        with Pool(workers, initializer=init_worker, initargs=(graph,)) as pool:
+            for source, tree in pool.imap_unordered(worker_tree, pending):
+                answer(source, tree)
+    return results
+
+# Hiérarchie de contraction (CH) pour les requêtes répétées sur un graphe
+# statique. Prétraitement : les nœuds sont contractés un par un, du moins
+# important au plus important ; contracter v ajoute un raccourci u -> x
+# (de poids w(u, v) + w(v, x), milieu v) pour chaque paire de voisins
+# encore présents dont le plus court chemin passe par v, ce que vérifie une
+# recherche de témoin (Dijkstra local sans v, limitée à witness_limit
+# nœuds ; sans réponse, on ajoute le raccourci, ce qui reste exact). L'ordre est
+# choisi par une file de priorité paresseuse (priorité recalculée au
+# moment de sortir de la file) : 2 × (raccourcis ajoutés - arcs supprimés)
+# + voisins déjà contractés + niveau, le niveau d'un nœud étant 1 de plus
+# que celui de ses voisins contractés ; les deux derniers termes répartissent
+# les contractions sur tout le graphe. Chaque nœud garde ensuite
+# seulement ses arcs vers des nœuds de rang supérieur : up (u -> x) et
+# down (x -> u, rangés chez u). Une requête est un Dijkstra bidirectionnel
+# qui ne monte jamais que vers des rangs supérieurs, puis les raccourcis
+# du chemin trouvé sont dépliés récursivement par leur milieu.
+EDGE_DIFFERENCE_WEIGHT = 2
+LEVEL_WEIGHT = 1
+# En-tête du fichier : magique, version, nœuds, arcs up, arcs down, complété
+# à 32 octets pour que le premier tableau commence aligné sur 8 octets
+CH_MAGIC = b'CHGR'
+CH_VERSION = 2
+CH_HEADER = struct.Struct('<4sIIQQ4x')
+
+class ContractionHierarchy:
+    def __init__(self, rank, up, down, names=None):
+        self.rank = rank
+        self.up = up  # (offsets, targets, weights, middles)
+        self.down = down
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)} if names is not None else None
+        self.mmap = None
+        self.file = None
+
+    @property
+    def num_nodes(self):
+        return len(self.rank)
+
+    def num_shortcuts(self):
+        return sum(1 for middles in (self.up[3], self.down[3]) for m in middles if m != -1)
+
+    def node_id(self, node):
+        return self.index[node] if self.index is not None else node
+
+    def node_name(self, u):
+        return self.names[u] if self.names is not None else u
+
+    @classmethod
+    def build(cls, graph, witness_limit=64):
+        n = graph.num_nodes
+        # Graphe restant : out_edges[u][x] = in_edges[x][u] = (poids, milieu)
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in range(n):
+            for i in range(graph.offsets[u], graph.offsets[u + 1]):
+                x, w = graph.targets[i], graph.weights[i]
+                if x != u and (x not in out_edges[u] or w < out_edges[u][x][0]):
+                    out_edges[u][x] = in_edges[x][u] = (w, -1)
+        contracted_neighbors = array('i', bytes(4 * n))
+        level = array('i', bytes(4 * n))
+
+        # Raccourcis nécessaires pour contracter v
+        def shortcuts(v):
+            result = []
+            outgoing = out_edges[v]
+            for u, (w_in, _) in in_edges[v].items():
+                targets = {x: w_in + w_out for x, (w_out, _) in outgoing.items() if x != u}
+                if not targets:
+                    continue
+                limit = max(targets.values())
+                distances = {u: 0}
+                pq = [(0, u)]
+                settled = 0
+                while pq and settled < witness_limit:
+                    d, a = heapq.heappop(pq)
+                    if d > distances[a]:
+                        continue
+                    if d > limit:
+                        break
+                    settled += 1
+                    for b, (w, _) in out_edges[a].items():
+                        if b != v and d + w < distances.get(b, INFINITY):
+                            distances[b] = d + w
+                            heapq.heappush(pq, (d + w, b))
+                for x, w in targets.items():
+                    if distances.get(x, INFINITY) > w:
+                        result.append((u, x, w))
+            return result
+
+        def priority(v, added):
+            return EDGE_DIFFERENCE_WEIGHT * (len(added) - len(in_edges[v]) - len(out_edges[v])) \
+                + contracted_neighbors[v] + LEVEL_WEIGHT * level[v]
+
+        pq = []
+        for v in range(n):
+            pq.append((priority(v, shortcuts(v)), v))
+        heapq.heapify(pq)
+        rank = array('i', bytes(4 * n))
+        up = [None] * n
+        down = [None] * n
+        order = 0
+        while pq:
+            _, v = heapq.heappop(pq)
+            added = shortcuts(v)
+            # Mise à jour paresseuse : si v n'est plus le minimum, on le remet
+            current = priority(v, added)
+            if pq and current > pq[0][0]:
+                heapq.heappush(pq, (current, v))
+                continue
+            rank[v] = order
+            order += 1
+            for u, x, w in added:
+                if x not in out_edges[u] or w < out_edges[u][x][0]:
+                    out_edges[u][x] = in_edges[x][u] = (w, v)
+            up[v] = out_edges[v]
+            down[v] = in_edges[v]
+            for x in up[v]:
+                del in_edges[x][v]
+                contracted_neighbors[x] += 1
+                level[x] = max(level[x], level[v] + 1)
+            for u in down[v]:
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+            out_edges[v] = in_edges[v] = None
+
+        def csr(edges):
+            offsets, targets, weights, middles = array('q', [0]), array('i'), array('d'), array('i')
+            for u in range(n):
+                for x, (w, m) in edges[u].items():
+                    targets.append(x)
+                    weights.append(w)
+                    middles.append(m)
+                offsets.append(len(targets))
+            return offsets, targets, weights, middles
+
+        return cls(rank, csr(up), csr(down), graph.names)
+
+    # Fichier : en-tête puis rank et les deux CSR, chaque tableau aligné sur
+    # 8 octets, pour pouvoir être projeté en mémoire tel quel par load
+    def save(self, path):
+        arrays = [self.rank, *self.up, *self.down]
+        with open(path, 'wb') as f:
+            f.write(CH_HEADER.pack(CH_MAGIC, CH_VERSION, self.num_nodes, len(self.up[1]), len(self.down[1])))
+            for values in arrays:
+                data = memoryview(values).cast('B')
+                f.write(data)
+                f.write(bytes(-len(data) % 8))
+
+    # Projection en mémoire d'un fichier écrit par save : les tableaux sont
+    # des vues sur le fichier, rien n'est copié. names (les étiquettes du
+    # graphe d'origine, non enregistrées) permet de retrouver les nœuds.
+    @classmethod
+    def load(cls, path, names=None):
+        f = open(path, 'rb')
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, num_up, num_down = CH_HEADER.unpack_from(data, 0)
+        if magic != CH_MAGIC or version != CH_VERSION:
+            data.close()
+            f.close()
+            raise ValueError(f"{path} is not a version {CH_VERSION} contraction hierarchy")
+        view = memoryview(data)
+        position = CH_HEADER.size
+        arrays = []
+        for typecode, length in (('i', n), ('q', n + 1), ('i', num_up), ('d', num_up), ('i', num_up),
+                                 ('q', n + 1), ('i', num_down), ('d', num_down), ('i', num_down)):
+            size = length * array(typecode).itemsize
+            arrays.append(view[position:position + size].cast(typecode))
+            position += size + (-size % 8)
+        hierarchy = cls(arrays[0], tuple(arrays[1:5]), tuple(arrays[5:9]), names)
+        hierarchy.mmap = data
+        hierarchy.file = f
+        return hierarchy
+
+    def close(self):
+        if self.mmap is not None:
+            self.rank = self.up = self.down = None  # les vues doivent disparaître avant
+            self.mmap.close()
+            self.file.close()
+            self.mmap = self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Arc u -> x de poids minimal dans le CSR edges : (poids, milieu)
+    def edge(self, edges, u, x):
+        offsets, targets, weights, middles = edges
+        return min((weights[i], middles[i]) for i in range(offsets[u], offsets[u + 1]) if targets[i] == x)
+
+    # Déplie l'arc a -> b de milieu m en arcs d'origine ; a -> m est rangé
+    # chez m dans down, m -> b dans up (m a le rang le plus bas des trois)
+    def unpack(self, a, b, middle, path):
+        stack = [(a, b, middle)]
+        while stack:
+            a, b, m = stack.pop()
+            if m == -1:
+                path.append(b)
+            else:
+                stack.append((m, b, self.edge(self.up, m, b)[1]))
+                stack.append((a, m, self.edge(self.down, m, a)[1]))
+
+    # Plus court chemin de start à end : même résultat (chemin, distance)
+    # que dijkstra. workspace est un QueryWorkspace(hierarchy) réutilisable.
+    # Une recherche ne développe pas un nœud qu'un arc descendant depuis un
+    # nœud déjà atteint rejoint plus court (stall-on-demand) : sa distance
+    # n'est pas la bonne, et ses successeurs seront mieux atteints ailleurs.
+    def query(self, start, end, workspace=None):
+        source, target = self.node_id(start), self.node_id(end)
+        workspace = workspace or QueryWorkspace(self)
+        sides = [(self.up, self.down, workspace.forward), (self.down, self.up, workspace.backward)]
+        queues = [[(0, source)], [(0, target)]]
+        for _, _, side in sides:
+            side.reset()
+        workspace.forward.update(source, 0, -1)
+        workspace.backward.update(target, 0, -1)
+        best, meeting = INFINITY, -1
+
+        while queues[0] or queues[1]:
+            direction = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            queue = queues[direction]
+            current_distance, u = heapq.heappop(queue)
+            if current_distance >= best:
+                queue.clear()  # ce côté ne peut plus améliorer best
+                continue
+            (offsets, targets, weights, _), (stall_offsets, stall_targets, stall_weights, _), side = sides[direction]
+            distances, previous, stamp, epoch = side.distances, side.previous, side.stamp, side.epoch
+            if current_distance > distances[u]:
+                continue
+            other = sides[1 - direction][2]
+            if other.stamp[u] == other.epoch and current_distance + other.distances[u] < best:
+                best, meeting = current_distance + other.distances[u], u
+            stalled = False
+            for i in range(stall_offsets[u], stall_offsets[u + 1]):
+                x = stall_targets[i]
+                if stamp[x] == epoch and distances[x] + stall_weights[i] < current_distance:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                distance = current_distance + weights[i]
+                if stamp[v] != epoch or distance < distances[v]:
+                    distances[v] = distance
+                    previous[v] = u
+                    stamp[v] = epoch
+                    heapq.heappush(queue, (distance, v))
+
+        if meeting == -1:
+            return [self.node_name(target)], INFINITY
+        # Chemin montant source -> meeting, puis descendant meeting -> target
+        chain = []
+        u = meeting
+        while u != source:
+            chain.append(u)
+            u = workspace.forward.predecessor(u)
+        path = [source]
+        a = source
+        for b in reversed(chain):
+            self.unpack(a, b, self.edge(self.up, a, b)[1], path)
+            a = b
+        u = meeting
+        while u != target:
+            b = workspace.backward.predecessor(u)
+            self.unpack(u, b, self.edge(self.down, b, u)[1], path)
+            u = b
+        return [self.node_name(u) for u in path], best
+
+def solve_shortest_path(edge_file=None, start='A', end='E'):
+    if edge_file is None:
+        # Graphe exemple (nœuds A, B, C, D, E)
+        graph = {
+            'A': {'B': 4, 'C': 2},
+            'B': {'A': 4, 'C': 1, 'D': 5},
+            'C': {'A': 2, 'B': 1, 'D': 8, 'E': 10},
+            'D': {'B': 5, 'C': 8, 'E': 2},
+            'E': {'C': 10, 'D': 2}
+        }
+        search = dijkstra
+    else:
+        # Graphe chargé depuis une liste d'arcs, au format CSR
+        load_start = time.time()
+        graph = load_edge_list(edge_file, numeric=False)
+        print(f"Loaded {graph.num_nodes} nodes and {graph.num_edges} edges in {time.time() - load_start:.2f} seconds")
+        search = dijkstra_csr
     # Mesure du temps et de la mémoire
     tracemalloc.start()
     start_time = time.time()
-    path, distance = dijkstra(graph, start, end)
+    path, distance = search(graph, start, end)
     end_time = time.time()
     current, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
@@ -56,4 +736,5 @@ def solve_shortest_path():
     print(f"Memory Usage: {peak / 1024:.2f} KB")
 
 if __name__ == "__main__":
-    solve_shortest_path()
\ No newline at end of file
+    # python shortest_path.py [fichier_arcs départ arrivée]
+    solve_shortest_path(*sys.argv[1:4])
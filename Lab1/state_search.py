@@ -0,0 +1,127 @@
+import time
+from collections import deque
+
+# Moteur de recherche générique dans un espace d'états. Un problème est
+# décrit par des fonctions : successors(state) -> états suivants,
+# is_goal(state) -> bool, et éventuellement cost(state, next_state) pour
+# le coût d'une étape (1 par défaut). Les états doivent être hachables ;
+# des entiers (voir pack_state) sont le plus compact. Chaque état visité
+# garde seulement un pointeur vers son parent, jamais une copie du chemin.
+# Toutes les recherches renvoient (chemin, coût, explorés, temps).
+
+# Encode une suite de bits (0/1) en entier, le premier élément en bit 0
+def pack_state(bits):
+    code = 0
+    for i, bit in enumerate(bits):
+        code |= bit << i
+    return code
+
+def unpack_state(code, width):
+    return tuple((code >> i) & 1 for i in range(width))
+
+def reconstruct_path(parent, state):
+    path = []
+    while state is not None:
+        path.append(state)
+        state = parent[state]
+    path.reverse()
+    return path
+
+def path_cost(path, cost=None):
+    if cost is None:
+        return len(path) - 1
+    return sum(cost(a, b) for a, b in zip(path, path[1:]))
+
+# Recherche en largeur
+def bfs(start, successors, is_goal, cost=None):
+    parent = {start: None}
+    queue = deque([start])
+    explored = 0
+    start_time = time.time()
+    while queue:
+        state = queue.popleft()
+        explored += 1
+        if is_goal(state):
+            path = reconstruct_path(parent, state)
+            return path, path_cost(path, cost), explored, time.time() - start_time
+        for next_state in successors(state):
+            if next_state not in parent:
+                parent[next_state] = state
+                queue.append(next_state)
+    return None, None, explored, time.time() - start_time
+
+# Recherche en largeur bidirectionnelle entre start et goal. predecessors
+# donne les états qui mènent à un état ; par défaut les coups sont supposés
+# réversibles (predecessors = successors). On développe à chaque fois un
+# niveau entier du côté dont la frontière est la plus petite ; au premier
+# niveau où les deux côtés se rencontrent, on garde la rencontre la plus courte.
+def bidirectional_bfs(start, goal, successors, predecessors=None, cost=None):
+    predecessors = predecessors or successors
+    start_time = time.time()
+    if start == goal:
+        return [start], 0, 1, time.time() - start_time
+    parents = [{start: None}, {goal: None}]
+    frontiers = [[start], [goal]]
+    expand = [successors, predecessors]
+    explored = 0
+
+    def depth(parent, state):
+        d = 0
+        while parent[state] is not None:
+            state = parent[state]
+            d += 1
+        return d
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, other = parents[side], parents[1 - side]
+        next_frontier = []
+        meetings = []
+        for state in frontiers[side]:
+            explored += 1
+            for next_state in expand[side](state):
+                if next_state not in parent:
+                    parent[next_state] = state
+                    next_frontier.append(next_state)
+                    if next_state in other:
+                        meetings.append(next_state)
+        frontiers[side] = next_frontier
+        if meetings:
+            meeting = min(meetings, key=lambda state: depth(other, state))
+            forward = reconstruct_path(parents[0], meeting)
+            backward = reconstruct_path(parents[1], meeting)
+            path = forward + backward[-2::-1]
+            return path, path_cost(path, cost), explored, time.time() - start_time
+    return None, None, explored, time.time() - start_time
+
+# Approfondissement itératif : recherche en profondeur limitée, la limite
+# augmentant de 1 à chaque itération. Seul le chemin courant est gardé en
+# mémoire (les cycles sont évités le long de ce chemin).
+def iterative_deepening(start, successors, is_goal, max_depth=100, cost=None):
+    explored = 0
+    start_time = time.time()
+    for limit in range(max_depth + 1):
+        path = [start]
+        on_path = {start}
+        stack = [iter(successors(start))] if limit > 0 else []
+        explored += 1
+        if is_goal(start):
+            return path, path_cost(path, cost), explored, time.time() - start_time
+        while stack:
+            next_state = next(stack[-1], None)
+            if next_state is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if next_state in on_path:
+                continue
+            explored += 1
+            path.append(next_state)
+            on_path.add(next_state)
+            if is_goal(next_state):
+                return path, path_cost(path, cost), explored, time.time() - start_time
+            if len(path) - 1 < limit:
+                stack.append(iter(successors(next_state)))
+            else:
+                on_path.discard(path.pop())
+    return None, None, explored, time.time() - start_time
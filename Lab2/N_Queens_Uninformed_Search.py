@@ -1,6 +1,20 @@
+import mmap
+import os
+import sys
+import tempfile
 import time
+from array import array
 from collections import deque
-import heapq
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+# best_first.py sits at the repository root, shared by Lab2 and Lab3; a lab
+# script run directly only has its own folder on sys.path
+try:
+    from best_first import best_first_search
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from best_first import best_first_search
 
 def is_safe(state, row, col):
     for r in range(row):
@@ -8,13 +22,21 @@ def is_safe(state, row, col):
             return False
     return True
 
-def dfs(N):
+# hooks (see search_hooks.py at the repository root) receive expand (depth)
+# and generate events and time is_safe
+def dfs(N, hooks=None):
+    safe = is_safe if hooks is None else hooks.timed('is_safe', is_safe)
+
     def _dfs(row, state, explored):
         explored[0] += 1
+        if hooks is not None:
+            hooks.emit('expand', row)
         if row == N:
             return state[:]
         for col in range(N):
-            if is_safe(state, row, col):
+            if safe(state, row, col):
+                if hooks is not None:
+                    hooks.emit('generate', row + 1)
                 state.append(col)
                 result = _dfs(row + 1, state, explored)
                 if result is not None:
@@ -23,92 +45,182 @@ def dfs(N):
         return None
 
     explored = [0]
-    start_time = time.time()
+    start_time = time.process_time()
     solution = _dfs(0, [], explored)
-    end_time = time.time()
+    end_time = time.process_time()
     return solution, explored[0], end_time - start_time
 
-def bfs(N):
+# hooks receive expand (frontier size) and generate events and time is_safe
+def bfs(N, hooks=None):
+    safe = is_safe if hooks is None else hooks.timed('is_safe', is_safe)
     queue = deque([[]])
     explored = 0
-    start_time = time.time()
+    start_time = time.process_time()
     while queue:
         state = queue.popleft()
         explored += 1
+        if hooks is not None:
+            hooks.emit('expand', len(queue))
         row = len(state)
         if row == N:
-            end_time = time.time()
+            end_time = time.process_time()
             return state, explored, end_time - start_time
         for col in range(N):
-            if is_safe(state, row, col):
+            if safe(state, row, col):
                 queue.append(state + [col])
-    end_time = time.time()
+                if hooks is not None:
+                    hooks.emit('generate', row + 1)
+    end_time = time.process_time()
     return None, explored, end_time - start_time
 
-def ucs(N, cost_func):
-    pq = [(0, [])]  # (total_cost, state)
+# One BFS level stored as packed integers (parent index << 8 | col), so a
+# partial state is never copied: it is rebuilt by following parent indices
+# back through the earlier levels. Once a level outgrows ram_budget bytes it
+# is written to a temporary file and read back through a memory map.
+class FrontierLevel:
+    def __init__(self, ram_budget=None, spill_dir=None):
+        self.nodes = array('q')
+        self.ram_budget = ram_budget
+        self.spill_dir = spill_dir
+        self.file = None
+        self.mmap = None
+        self.count = 0
+
+    def append(self, parent, col):
+        self.nodes.append(parent << 8 | col)
+        self.count += 1
+        if self.ram_budget is not None and len(self.nodes) * self.nodes.itemsize > self.ram_budget:
+            if self.file is None:
+                self.file = tempfile.TemporaryFile(dir=self.spill_dir)
+            self.nodes.tofile(self.file)
+            del self.nodes[:]
+
+    # Stop appending; spilled levels are memory-mapped for reading
+    def seal(self):
+        if self.file is not None:
+            self.nodes.tofile(self.file)
+            del self.nodes[:]
+            self.file.flush()
+            self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.nodes = memoryview(self.mmap).cast('q')
+
+    def ram_bytes(self):
+        return 0 if self.mmap is not None else len(self.nodes) * self.nodes.itemsize
+
+    def close(self):
+        if self.mmap is not None:
+            self.nodes.release()
+            self.mmap.close()
+            self.file.close()
+
+    def __getitem__(self, index):
+        return self.nodes[index]
+
+    def __len__(self):
+        return self.count
+
+def compact_bfs(N, ram_budget=None, spill_dir=None):
+    levels = [FrontierLevel(ram_budget, spill_dir)]
+    levels[0].append(0, 0)  # root: the empty state
+    levels[0].seal()
+    sealed_bytes = levels[0].ram_bytes()
+    peak_bytes = sealed_bytes
     explored = 0
-    start_time = time.time()
-    while pq:
-        cost, state = heapq.heappop(pq)
-        explored += 1
-        row = len(state)
-        if row == N:
-            end_time = time.time()
-            return state, cost, explored, end_time - start_time
-        for col in range(N):
-            if is_safe(state, row, col):
-                new_state = state + [col]
-                new_cost = cost + cost_func(col)
-                heapq.heappush(pq, (new_cost, new_state))
-    end_time = time.time()
-    return None, None, explored, end_time - start_time
+    start_time = time.process_time()
+
+    def rebuild(depth, index):
+        state = [0] * depth
+        for row in range(depth, 0, -1):
+            packed = levels[row][index]
+            state[row - 1] = packed & 0xFF
+            index = packed >> 8
+        return state
+
+    try:
+        for row in range(N + 1):
+            current = levels[row]
+            children = FrontierLevel(ram_budget, spill_dir)
+            for index in range(len(current)):
+                explored += 1
+                state = rebuild(row, index)
+                if row == N:
+                    end_time = time.process_time()
+                    return state, explored, end_time - start_time, peak_bytes
+                for col in range(N):
+                    if is_safe(state, row, col):
+                        children.append(index, col)
+                peak_bytes = max(peak_bytes, sealed_bytes + children.ram_bytes())
+            children.seal()
+            sealed_bytes += children.ram_bytes()
+            levels.append(children)
+    finally:
+        for level in levels:
+            level.close()
+    end_time = time.process_time()
+    return None, explored, end_time - start_time, peak_bytes
+
+def ucs(N, cost_func, transposition=False, symmetry=False, hooks=None):
+    return best_first_search(N, cost_func, transposition=transposition, symmetry=symmetry, hooks=hooks)
 
 def calculate_cost(state, cost_func):
     return sum(cost_func(col) for col in state) if state else None
 
-def run_experiments():
+def cost_col_plus_one(col):
+    return col + 1  # Cost increases with column index
+
+def cost_n_minus_col(N, col):
+    return N - col  # Cost decreases with column index
+
+def run_trial(N, algorithm):
+    cost_func1 = cost_col_plus_one
+    frontier_bytes = None
+    if algorithm == 'DFS':
+        solution, explored, time_taken = dfs(N)
+        cost = calculate_cost(solution, cost_func1) if solution else None
+    elif algorithm == 'BFS':
+        solution, explored, time_taken = bfs(N)
+        cost = calculate_cost(solution, cost_func1) if solution else None
+    elif algorithm == 'BFS (compact)':
+        solution, explored, time_taken, frontier_bytes = compact_bfs(N)
+        cost = calculate_cost(solution, cost_func1) if solution else None
+    elif algorithm == 'UCS (col+1)':
+        solution, cost, explored, time_taken = ucs(N, cost_func1)
+    else:
+        solution, cost, explored, time_taken = ucs(N, partial(cost_n_minus_col, N))
+    return {
+        'N': N, 'Algorithm': algorithm, 'Solution': solution, 'Cost': cost,
+        'Explored': explored, 'Time': time_taken, 'Depth': N if solution else None,
+        'Frontier Bytes': frontier_bytes
+    }
+
+def run_experiments(workers=1):
     N_values = [4, 5, 6]
-    cost_func1 = lambda col: col + 1  # Cost increases with column index
-    cost_func2 = lambda col: N - col  # Cost decreases with column index
+    algorithms = ['DFS', 'BFS', 'BFS (compact)', 'UCS (col+1)', 'UCS (N-col)']
+    trials = [(N, algorithm) for N in N_values for algorithm in algorithms]
     results = []
 
-    for N in N_values:
-        print(f"\n=== N = {N} ===")
-        
-        # DFS
-        dfs_solution, dfs_explored, dfs_time = dfs(N)
-        dfs_cost = calculate_cost(dfs_solution, cost_func1) if dfs_solution else None
-        print(f"DFS: Solution = {dfs_solution}, Cost = {dfs_cost}, Explored = {dfs_explored}, Time = {dfs_time:.6f}s")
-        results.append({
-            'N': N, 'Algorithm': 'DFS', 'Solution': dfs_solution, 'Cost': dfs_cost,
-            'Explored': dfs_explored, 'Time': dfs_time, 'Depth': N if dfs_solution else None
-        })
-
-        # BFS
-        bfs_solution, bfs_explored, bfs_time = bfs(N)
-        bfs_cost = calculate_cost(bfs_solution, cost_func1) if bfs_solution else None
-        print(f"BFS: Solution = {bfs_solution}, Cost = {bfs_cost}, Explored = {bfs_explored}, Time = {bfs_time:.6f}s")
-        results.append({
-            'N': N, 'Algorithm': 'BFS', 'Solution': bfs_solution, 'Cost': bfs_cost,
-            'Explored': bfs_explored, 'Time': bfs_time, 'Depth': N if bfs_solution else None
-        })
-
-        # UCS with cost_func1
-        ucs_solution, ucs_cost, ucs_explored, ucs_time = ucs(N, cost_func1)
-        print(f"UCS (cost=col+1): Solution = {ucs_solution}, Cost = {ucs_cost}, Explored = {ucs_explored}, Time = {ucs_time:.6f}s")
-        results.append({
-            'N': N, 'Algorithm': 'UCS (col+1)', 'Solution': ucs_solution, 'Cost': ucs_cost,
-            'Explored': ucs_explored, 'Time': ucs_time, 'Depth': N if ucs_solution else None
-        })
-
-        # UCS with cost_func2
-        ucs_solution2, ucs_cost2, ucs_explored2, ucs_time2 = ucs(N, cost_func2)
-        print(f"UCS (cost=N-col): Solution = {ucs_solution2}, Cost = {ucs_cost2}, Explored = {ucs_explored2}, Time = {ucs_time2:.6f}s")
-        results.append({
-            'N': N, 'Algorithm': 'UCS (N-col)', 'Solution': ucs_solution2, 'Cost': ucs_cost2,
-            'Explored': ucs_explored2, 'Time': ucs_time2, 'Depth': N if ucs_solution else None
-        })
+    def report(result):
+        frontier = f", Frontier = {result['Frontier Bytes']} bytes" if result['Frontier Bytes'] is not None else ""
+        print(f"{result['Algorithm']}: Solution = {result['Solution']}, Cost = {result['Cost']}, "
+              f"Explored = {result['Explored']}, Time = {result['Time']:.6f}s{frontier}")
+
+    if workers == 1:
+        for N in N_values:
+            print(f"\n=== N = {N} ===")
+            for algorithm in algorithms:
+                result = run_trial(N, algorithm)
+                report(result)
+                results.append(result)
+    else:
+        # Report trials as they finish, then restore the sweep order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_trial, *trial) for trial in trials]
+            for future in as_completed(futures):
+                result = future.result()
+                print(f"N = {result['N']}, ", end="")
+                report(result)
+                results.append(result)
+        results.sort(key=lambda result: trials.index((result['N'], result['Algorithm'])))
 
     return results
 
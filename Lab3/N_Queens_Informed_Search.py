@@ -1,131 +1,115 @@
-import heapq
-import time
-
-def is_safe(state, row, col):
-    for r in range(row):
-        if state[r] == col or abs(state[r] - col) == row - r:
-            return False
-    return True
-
-def min_cost_for_row(state, r, N, cost_func):
-    min_cost = float('inf')
-    for c in range(N):
-        if all(state[k] != c and abs(state[k] - c) != abs(k - r) for k in range(len(state))):
-            min_cost = min(min_cost, cost_func(c))
-    return min_cost if min_cost != float('inf') else 0
-
-def h2(state, N, cost_func):
-    depth = len(state)
-    return sum(min_cost_for_row(state, r, N, cost_func) for r in range(depth, N))
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# best_first.py sits at the repository root, shared by Lab2 and Lab3; a lab
+# script run directly only has its own folder on sys.path
+try:
+    from best_first import best_first_search
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from best_first import best_first_search
 
 cost_func = lambda c: c + 1
 min_cost = 1
 
-def ucs(N):
-    pq = [(0, [], 0)]  # (priority, state, cost)
-    explored = 0
-    start_time = time.time()
-    while pq:
-        _, state, cost = heapq.heappop(pq)
-        explored += 1
-        depth = len(state)
-        if depth == N:
-            end_time = time.time()
-            return state, cost, explored, end_time - start_time
-        for col in range(N):
-            if is_safe(state, depth, col):
-                new_state = state + [col]
-                new_cost = cost + cost_func(col)
-                heapq.heappush(pq, (new_cost, new_state, new_cost))
-    end_time = time.time()
-    return None, None, explored, end_time - start_time
-
-def astar_h1(N):
-    pq = [(0 + N * min_cost, [], 0)]  # (f, state, cost)
-    explored = 0
-    start_time = time.time()
-    while pq:
-        _, state, cost = heapq.heappop(pq)
-        explored += 1
-        depth = len(state)
-        if depth == N:
-            end_time = time.time()
-            return state, cost, explored, end_time - start_time
-        for col in range(N):
-            if is_safe(state, depth, col):
-                new_state = state + [col]
-                new_cost = cost + cost_func(col)
-                h = (N - depth - 1) * min_cost
-                f = new_cost + h
-                heapq.heappush(pq, (f, new_state, new_cost))
-    end_time = time.time()
-    return None, None, explored, end_time - start_time
-
-def astar_h2(N):
-    pq = [(0 + h2([], N, cost_func), [], 0)]  # (f, state, cost)
-    explored = 0
-    start_time = time.time()
-    while pq:
-        _, state, cost = heapq.heappop(pq)
-        explored += 1
-        depth = len(state)
-        if depth == N:
-            end_time = time.time()
-            return state, cost, explored, end_time - start_time
-        for col in range(N):
-            if is_safe(state, depth, col):
-                new_state = state + [col]
-                new_cost = cost + cost_func(col)
-                h = h2(new_state, N, cost_func)
-                f = new_cost + h
-                heapq.heappush(pq, (f, new_state, new_cost))
-    end_time = time.time()
-    return None, None, explored, end_time - start_time
-
-def greedy_bfs(N):
-    def h(state):
-        depth = len(state)
-        if depth == N:
-            return 0
-        safe_count = sum(1 for col in range(N) if is_safe(state, depth, col))
-        return -safe_count
-
-    pq = [(h([]), [])]  # (h, state)
-    explored = 0
-    start_time = time.time()
-    while pq:
-        _, state = heapq.heappop(pq)
-        explored += 1
-        depth = len(state)
+def ucs(N, transposition=False, symmetry=False, hooks=None):
+    return best_first_search(N, cost_func, transposition=transposition, symmetry=symmetry, hooks=hooks)
+
+def astar_h1(N, transposition=False, symmetry=False, hooks=None):
+    def h1(depth, cols, diag1, diag2, parent_data, col):
+        return (N - depth) * min_cost, None
+    return best_first_search(N, cost_func, h1, transposition=transposition, symmetry=symmetry, hooks=hooks)
+
+# h2 maintained incrementally. Each node carries the cheapest free column of
+# every remaining row. A new queen can only take columns away, so a child
+# only rescans the rows whose cheapest column it now attacks. Results are
+# memoized by (depth, masks), the canonical form of everything h2 depends on.
+def make_h2(N):
+    by_cost = sorted(range(N), key=cost_func)
+    memo = {}
+
+    # Cheapest column free of attacks `ahead` rows below the next row, or -1
+    def cheapest(cols, diag1, diag2, ahead):
+        attacked = cols | (diag1 << ahead) | (diag2 >> ahead)
+        for c in by_cost:
+            if not attacked >> c & 1:
+                return c
+        return -1
+
+    def heuristic(depth, cols, diag1, diag2, parent_best=None, queen=None):
+        key = (depth, cols, diag1, diag2)
+        if key in memo:
+            return memo[key]
+        best = []
+        for ahead in range(N - depth):
+            if parent_best is None:
+                c = cheapest(cols, diag1, diag2, ahead)
+            else:
+                c = parent_best[ahead + 1]
+                distance = ahead + 1
+                if c >= 0 and (c == queen or c == queen + distance or c == queen - distance):
+                    c = cheapest(cols, diag1, diag2, ahead)
+            best.append(c)
+        result = (sum(cost_func(c) for c in best if c >= 0), tuple(best))
+        memo[key] = result
+        return result
+
+    return heuristic
+
+def astar_h2(N, transposition=False, symmetry=False, hooks=None):
+    return best_first_search(N, cost_func, make_h2(N), transposition=transposition, symmetry=symmetry,
+                             hooks=hooks)
+
+def greedy_bfs(N, transposition=False, symmetry=False, hooks=None):
+    full = (1 << N) - 1
+    def h(depth, cols, diag1, diag2, parent_data, col):
         if depth == N:
-            end_time = time.time()
-            cost = sum(cost_func(col) for col in state)
-            return state, cost, explored, end_time - start_time
-        for col in range(N):
-            if is_safe(state, depth, col):
-                new_state = state + [col]
-                heapq.heappush(pq, (h(new_state), new_state))
-    end_time = time.time()
-    return None, None, explored, end_time - start_time
-
-def run_experiments():
-    N_values = [4, 5]
-    algorithms = {
-        'UCS': ucs,
-        'A* h1': astar_h1,
-        'A* h2': astar_h2,
-        'Greedy': greedy_bfs
+            return 0, None
+        return -bin(full & ~(cols | diag1 | diag2)).count('1'), None  # minus the safe columns of the next row
+    return best_first_search(N, cost_func, h, use_cost=False, transposition=transposition, symmetry=symmetry,
+                             hooks=hooks)
+
+ALGORITHMS = {
+    'UCS': ucs,
+    'A* h1': astar_h1,
+    'A* h2': astar_h2,
+    'Greedy': greedy_bfs
+}
+
+def run_trial(N, name):
+    solution, cost, explored, time_taken = ALGORITHMS[name](N)
+    return {
+        'N': N, 'Algorithm': name, 'Solution': solution, 'Cost': cost,
+        'Explored': explored, 'Time': time_taken, 'Depth': N if solution else None
     }
+
+def run_experiments(workers=1):
+    N_values = [4, 5]
     results = []
-    for N in N_values:
-        print(f"\n=== N = {N} ===")
-        for name, algo in algorithms.items():
-            solution, cost, explored, time_taken = algo(N)
-            print(f"{name}: Solution = {solution}, Cost = {cost}, Explored = {explored}, Time = {time_taken:.6f}s")
-            results.append({
-                'N': N, 'Algorithm': name, 'Solution': solution, 'Cost': cost,
-                'Explored': explored, 'Time': time_taken, 'Depth': N if solution else None
-            })
+
+    def report(result):
+        print(f"{result['Algorithm']}: Solution = {result['Solution']}, Cost = {result['Cost']}, "
+              f"Explored = {result['Explored']}, Time = {result['Time']:.6f}s")
+
+    if workers == 1:
+        for N in N_values:
+            print(f"\n=== N = {N} ===")
+            for name in ALGORITHMS:
+                result = run_trial(N, name)
+                report(result)
+                results.append(result)
+    else:
+        # Report trials as they finish, then restore the sweep order
+        trials = [(N, name) for N in N_values for name in ALGORITHMS]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_trial, *trial) for trial in trials]
+            for future in as_completed(futures):
+                result = future.result()
+                print(f"N = {result['N']}, ", end="")
+                report(result)
+                results.append(result)
+        results.sort(key=lambda result: trials.index((result['N'], result['Algorithm'])))
     return results
 
 if __name__ == "__main__":
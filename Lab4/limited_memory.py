@@ -0,0 +1,589 @@
+import random
+import sys
+import time
+from array import array
+from heapq import heapify, heappush, heappop
+
+from maze_generator import OPEN, Maze, generate_maze
+
+# Limited-memory informed search (RBFS, SMA*, IDA*) on grid mazes.
+#
+# Mazes are Maze objects from maze_generator: a flat byte grid with a wall
+# border and precomputed neighbor offsets. Search states are flat cell
+# indices; positions are (row, col) tuples only at the edges (the start and
+# goal arguments, the returned paths). RBFS and IDA* keep their recursion on
+# an explicit stack, so the depth of the search is not limited by
+# sys.getrecursionlimit().
+
+# Node class for RBFS
+class Node:
+    __slots__ = ('state', 'parent', 'g', 'h', 'f')
+
+    def __init__(self, state, parent=None, g=0, h=0):
+        self.state = state  # flat cell index
+        self.parent = parent
+        self.g = g  # Cost to reach node
+        self.h = h  # Heuristic estimate
+        self.f = g + h  # Estimated total cost
+
+# Heuristic: Manhattan distance to goal, on flat cell indices
+def manhattan_heuristic(maze, goal):
+    w = maze.width
+    goal_r, goal_c = divmod(goal, w)
+    return lambda i: abs(i // w - goal_r) + abs(i % w - goal_c)
+
+def as_maze(grid):
+    return grid if isinstance(grid, Maze) else Maze.from_rows(grid)
+
+# Reconstruct path from goal node
+def reconstruct_path(maze, node):
+    path = []
+    while node:
+        path.append(maze.position(node.state))
+        node = node.parent
+    return path[::-1]
+
+# RBFS Implementation. Each stack frame is one recursive call of the
+# textbook version: [node, f_limit, sorted successors]. When a child
+# returns, its backed-up f replaces the f of successors[0], the child that
+# was entered. Memory is the number of nodes held by all frames.
+def rbfs(grid, start_pos, goal_pos, timeout=30):
+    maze = as_maze(grid)
+    cells, offsets = maze.cells, maze.offsets
+    goal = maze.index(goal_pos)
+    heuristic = manhattan_heuristic(maze, goal)
+    start = maze.index(start_pos)
+    on_path = bytearray(len(cells))
+    root = Node(start, h=heuristic(start))
+    iterations = 0
+    held = 1
+    max_memory = 1
+    start_time = time.time()
+    stack = [[root, float('inf'), None]]
+    returned = None
+    result = None
+
+    while stack:
+        frame = stack[-1]
+        node, f_limit, successors = frame
+        if successors is None:
+            iterations += 1
+            if time.time() - start_time > timeout:
+                print("RBFS timed out after", timeout, "seconds")
+                return None, iterations, time.time() - start_time, max_memory
+            if node.state == goal:
+                result = node
+                break
+            on_path[node.state] = 1
+            successors = []
+            for offset in offsets:
+                nxt = node.state + offset
+                if cells[nxt] == OPEN and not on_path[nxt]:
+                    child = Node(nxt, parent=node, g=node.g + 1, h=heuristic(nxt))
+                    child.f = max(child.f, node.f)
+                    successors.append(child)
+            frame[2] = successors
+            held += len(successors)
+            max_memory = max(max_memory, held)
+        elif returned is not None:
+            successors[0].f = returned
+            returned = None
+        if successors:
+            successors.sort(key=lambda x: x.f)
+            best = successors[0]
+        if not successors or best.f > f_limit:
+            returned = best.f if successors else float('inf')
+            on_path[node.state] = 0
+            held -= len(successors)
+            stack.pop()
+            continue
+        alternative = successors[1].f if len(successors) > 1 else float('inf')
+        stack.append([best, min(f_limit, alternative), None])
+
+    exec_time = time.time() - start_time
+    path = reconstruct_path(maze, result) if result else None
+    return path, iterations, exec_time, max_memory
+
+# SMA* node. moves, children and forgotten are filled on first expansion:
+# moves[k] is the k-th successor cell, children[k] the child kept in memory
+# for it (or None) and forgotten[k] the f backed up from a dropped child
+# (or None). next_new counts the moves generated at least once.
+class SMANode:
+    __slots__ = ('key', 'state', 'parent', 'slot', 'g', 'f', 'depth', 'moves', 'children',
+                 'forgotten', 'next_new', 'num_children', 'num_forgotten', 'version')
+
+    def __init__(self, key, state, parent, slot, g, f):
+        self.key = key
+        self.state = state
+        self.parent = parent
+        self.slot = slot
+        self.g = g
+        self.f = f
+        self.depth = parent.depth + 1 if parent else 0
+        self.moves = None
+        self.children = None
+        self.forgotten = None
+        self.next_new = 0
+        self.num_children = 0
+        self.num_forgotten = 0
+        self.version = 0
+
+    def can_generate(self):
+        return self.moves is None or self.next_new < len(self.moves) or self.num_forgotten > 0
+
+    def fully_generated(self):
+        return self.moves is not None and self.next_new == len(self.moves)
+
+# Bytes charged for an SMA* node and for one heap entry. Sizes come from
+# sys.getsizeof on the objects the search actually builds; the int fields
+# are charged as separate int objects, since only ints up to 256 are
+# shared. The node table and the two heap lists are charged separately, at
+# their current allocated size, so their spare capacity counts too.
+INT_BYTES = sys.getsizeof(1 << 20)
+HEAP_ENTRY_BYTES = sys.getsizeof((0, 0, 0, 0)) + 3 * INT_BYTES
+
+# An expanded node also holds its moves, children and forgotten lists and
+# one int per move (cell indices)
+def sma_node_bytes(expanded=False, num_moves=4):
+    size = sys.getsizeof(SMANode(0, 0, None, 0, 0, 0)) + 4 * INT_BYTES
+    if expanded:
+        size += 3 * sys.getsizeof([None] * num_moves) + num_moves * INT_BYTES
+    return size
+
+# SMA* Implementation (Russell, 1992). Nodes are generated one successor at
+# a time. When the memory is full, the shallowest highest-f leaf is dropped
+# and its f is backed up into the parent's forgotten slot, so the parent
+# goes back on the open list and regenerates that child only if the
+# forgotten f becomes the best on offer. Once all successors of a node have
+# been generated, its f is backed up to the least f of its successors and
+# the change is propagated to the ancestors.
+#
+# best_g holds the least g at which each cell has been reached and
+# best_from the cell it was reached from. A successor is kept only if it
+# improves on best_g, so the same cell reached by two branches is searched
+# once; a regenerated node gets back the successors it owned. A successor
+# whose cell has been reached by a shorter path since its parent was
+# expanded is not generated (nor regenerated once forgotten), and no longer
+# counts in the parent's f. Like the on_path flags of IDA*, these tables
+# hold one entry per cell and are not charged against the memory limit.
+#
+# Nodes live in a key -> node table and the heaps hold keys, so a dropped
+# node is freed at once; heap entries left behind by dropped or updated
+# nodes are skipped when popped and removed in place when they pile up.
+# memory_limit is a node count; with memory_bytes, the limit is a number of
+# bytes instead, charged per node (sma_node_bytes), per heap entry and for
+# the allocated size of the node table and heap lists, and the returned
+# max_memory is in bytes as well. A node that cannot be kept in memory
+# together with its ancestors gets f = inf.
+def sma_star(grid, start_pos, goal_pos, memory_limit, timeout=30, memory_bytes=None):
+    maze = as_maze(grid)
+    cells, offsets = maze.cells, maze.offsets
+    goal = maze.index(goal_pos)
+    heuristic = manhattan_heuristic(maze, goal)
+    start = maze.index(start_pos)
+    inf = float('inf')
+    node_bytes = sma_node_bytes()
+    expanded_bytes = [sma_node_bytes(True, k) - node_bytes for k in range(len(offsets) + 1)]
+    root = SMANode(0, start, None, 0, 0, heuristic(start))
+    nodes = {0: root}
+    best_g = array('i', [0x7FFFFFFF]) * len(cells)
+    best_from = array('i', [-1]) * len(cells)
+    best_g[start] = 0
+    # Expansion order: least f, then deepest. Deletion order: greatest f, then shallowest.
+    open_heap = []
+    leaf_heap = []
+    next_key = 1
+    node_memory = node_bytes
+    iterations = 0
+    max_memory = 1
+    start_time = time.time()
+
+    def used():
+        if memory_bytes is None:
+            return len(nodes)
+        return node_memory + sys.getsizeof(nodes) + sys.getsizeof(open_heap) + sys.getsizeof(leaf_heap) \
+            + (len(open_heap) + len(leaf_heap)) * HEAP_ENTRY_BYTES
+
+    def limit_reached():
+        return used() > (memory_limit if memory_bytes is None else memory_bytes)
+
+    def push(node):
+        node.version += 1
+        if node.can_generate():
+            heappush(open_heap, (node.f, -node.depth, node.key, node.version))
+        if node.num_children == 0 and node.parent is not None:
+            heappush(leaf_heap, (-node.f, node.depth, node.key, node.version))
+
+    def live(entry):
+        node = nodes.get(entry[2])
+        return node if node is not None and node.version == entry[3] else None
+
+    # Remove stale entries in place, without a second copy of the heap
+    def compact():
+        for heap in (open_heap, leaf_heap):
+            size = 0
+            for entry in heap:
+                if live(entry):
+                    heap[size] = entry
+                    size += 1
+            del heap[size:]
+            heapify(heap)
+
+    def backup(node):
+        while node is not None and node.fully_generated():
+            values = [child.f for child in node.children if child is not None]
+            values += [f for f in node.forgotten if f is not None]
+            new_f = min(values, default=inf)
+            if new_f == node.f:
+                return
+            node.f = new_f
+            push(node)
+            node = node.parent
+
+    def drop(leaf):
+        nonlocal node_memory
+        parent = leaf.parent
+        parent.children[leaf.slot] = None
+        parent.forgotten[leaf.slot] = leaf.f
+        parent.num_children -= 1
+        parent.num_forgotten += 1
+        del nodes[leaf.key]
+        node_memory -= node_bytes + (expanded_bytes[len(leaf.moves)] if leaf.moves is not None else 0)
+        push(parent)
+
+    # Drop leaves other than keep until the memory fits; False if only keep is left.
+    def make_room(keep):
+        if memory_bytes is not None and limit_reached() and len(open_heap) + len(leaf_heap) > 2 * len(nodes):
+            compact()
+        kept = []
+        while limit_reached():
+            while leaf_heap:
+                node = live(leaf_heap[0])
+                if node is not None and node.num_children == 0 and node is not keep:
+                    break
+                entry = heappop(leaf_heap)
+                if node is keep:
+                    kept.append(entry)
+            if not leaf_heap:
+                return False
+            drop(nodes[heappop(leaf_heap)[2]])
+        for entry in kept:
+            heappush(leaf_heap, entry)
+        return True
+
+    push(root)
+    while open_heap:
+        if time.time() - start_time > timeout:
+            break
+        b = live(heappop(open_heap))
+        if b is None or not b.can_generate():
+            continue
+        if b.f == inf:
+            break
+        iterations += 1
+        if b.state == goal:
+            path = []
+            while b:
+                path.append(maze.position(b.state))
+                b = b.parent
+            return path[::-1], iterations, time.time() - start_time, max_memory
+        if b.moves is None:
+            # Open neighbors reached with a lower g than any path so far
+            # (this also rules out the cells on the path to b), or that b
+            # itself reached first if b is being regenerated
+            b.moves = []
+            g = b.g + 1
+            for offset in offsets:
+                nxt = b.state + offset
+                if cells[nxt] == OPEN and (g < best_g[nxt] or g == best_g[nxt] and best_from[nxt] == b.state):
+                    best_g[nxt] = g
+                    best_from[nxt] = b.state
+                    b.moves.append(nxt)
+            b.children = [None] * len(b.moves)
+            b.forgotten = [None] * len(b.moves)
+            node_memory += expanded_bytes[len(b.moves)]
+        if b.next_new < len(b.moves):
+            slot = b.next_new
+            b.next_new += 1
+            stored_f = b.f
+        elif b.num_forgotten:
+            slot = min((k for k, f in enumerate(b.forgotten) if f is not None), key=lambda k: b.forgotten[k])
+            stored_f = b.forgotten[slot]
+            b.forgotten[slot] = None
+            b.num_forgotten -= 1
+        else:
+            slot = None
+        if slot is not None and b.g + 1 > best_g[b.moves[slot]]:
+            # A shorter path to this cell was found since b was expanded
+            slot = None
+        if slot is not None:
+            nxt = b.moves[slot]
+            child = SMANode(next_key, nxt, b, slot, b.g + 1, max(stored_f, b.g + 1 + heuristic(nxt)))
+            nodes[next_key] = child
+            next_key += 1
+            b.children[slot] = child
+            b.num_children += 1
+            node_memory += node_bytes
+            push(child)
+        backup(b)
+        push(b)
+        if slot is not None and not make_room(child):
+            child.f = inf
+            drop(child)
+            backup(b)
+            make_room(None)
+        max_memory = max(max_memory, used())
+    return None, iterations, time.time() - start_time, max_memory
+
+# IDA* Implementation. One depth-first pass per f-bound; path holds the
+# cells of the current branch, next_move the index of the next offset to
+# try at each depth, and on_path flags them for the cycle check.
+def ida_star(grid, start_pos, goal_pos, timeout=30):
+    maze = as_maze(grid)
+    cells, offsets = maze.cells, maze.offsets
+    goal = maze.index(goal_pos)
+    heuristic = manhattan_heuristic(maze, goal)
+    start = maze.index(start_pos)
+    on_path = bytearray(len(cells))
+    iterations = 0
+    max_memory = 1
+    start_time = time.time()
+    bound = heuristic(start)
+
+    while True:
+        iterations += 1
+        if start == goal:
+            return [start_pos], iterations, time.time() - start_time, max_memory
+        path = [start]
+        next_move = [0]
+        on_path[start] = 1
+        min_exceeded = float('inf')
+        while path:
+            depth = len(path) - 1
+            move = next_move[depth]
+            if move == len(offsets):
+                on_path[path.pop()] = 0
+                next_move.pop()
+                continue
+            next_move[depth] = move + 1
+            nxt = path[depth] + offsets[move]
+            if cells[nxt] != OPEN or on_path[nxt]:
+                continue
+            iterations += 1
+            f = depth + 1 + heuristic(nxt)
+            if f > bound:
+                min_exceeded = min(min_exceeded, f)
+                continue
+            if nxt == goal:
+                path.append(nxt)
+                for cell in path:
+                    on_path[cell] = 0
+                max_memory = max(max_memory, len(path))
+                return [maze.position(cell) for cell in path], iterations, time.time() - start_time, max_memory
+            path.append(nxt)
+            next_move.append(0)
+            on_path[nxt] = 1
+            max_memory = max(max_memory, len(path))
+            if iterations & 0xFFFF == 0 and time.time() - start_time > timeout:
+                for cell in path:
+                    on_path[cell] = 0
+                print("IDA* timed out after", timeout, "seconds")
+                return None, iterations, time.time() - start_time, max_memory
+        if min_exceeded == float('inf'):
+            return None, iterations, time.time() - start_time, max_memory
+        bound = min_exceeded
+
+# IDA* with a transposition table kept across iterations. The table has
+# table_size buckets of two entries (cell, best g, iteration, best move):
+# the first entry is replaced only by a path of lower or equal g (entries
+# near the start prune the largest subtrees), the second always. A cell
+# reached with a g above the one in the table is pruned, and so is a
+# second visit at the same g in the same iteration. The best move of a
+# cell is the child whose subtree came closest to the bound; it is tried
+# first in the next iteration. Memory is table_size * 2 entries plus the
+# current path; re_expansions counts expansions of cells already expanded
+# earlier in the search.
+NO_MOVE = 4
+MOVE_ORDERS = [(m,) + tuple(k for k in range(4) if k != m) for m in range(4)] + [(0, 1, 2, 3)]
+
+def ida_star_tt(grid, start_pos, goal_pos, table_size=1 << 16, timeout=30):
+    maze = as_maze(grid)
+    cells, offsets = maze.cells, maze.offsets
+    goal = maze.index(goal_pos)
+    heuristic = manhattan_heuristic(maze, goal)
+    start = maze.index(start_pos)
+    on_path = bytearray(len(cells))
+    expanded = bytearray(len(cells))
+    table_cell = array('i', [-1]) * (2 * table_size)
+    table_g = array('i', [0]) * (2 * table_size)
+    table_round = array('i', [0]) * (2 * table_size)
+    table_move = bytearray([NO_MOVE]) * (2 * table_size)
+    iterations = 0
+    re_expansions = 0
+    max_memory = 1
+    start_time = time.time()
+    bound = heuristic(start)
+    inf = float('inf')
+    round_ = 0
+
+    def find(cell):
+        slot = 2 * (cell % table_size)
+        if table_cell[slot] == cell:
+            return slot
+        if table_cell[slot + 1] == cell:
+            return slot + 1
+        return -1
+
+    # Returns the best move stored for cell, or None if the visit is pruned
+    def probe(cell, g):
+        slot = find(cell)
+        if slot >= 0:
+            if table_g[slot] < g or (table_g[slot] == g and table_round[slot] == round_):
+                return None
+            table_g[slot] = g
+            table_round[slot] = round_
+            return table_move[slot]
+        slot = 2 * (cell % table_size)
+        if table_cell[slot] >= 0 and g > table_g[slot]:
+            slot += 1
+        table_cell[slot] = cell
+        table_g[slot] = g
+        table_round[slot] = round_
+        table_move[slot] = NO_MOVE
+        return NO_MOVE
+
+    while True:
+        round_ += 1
+        iterations += 1
+        if start == goal:
+            return [start_pos], iterations, time.time() - start_time, max_memory, re_expansions
+        path = [start]
+        order = [MOVE_ORDERS[probe(start, 0)]]
+        next_move = [0]
+        frame_min = [inf]
+        frame_best = [NO_MOVE]
+        on_path[start] = 1
+        if expanded[start]:
+            re_expansions += 1
+        expanded[start] = 1
+        while path:
+            depth = len(path) - 1
+            k = next_move[depth]
+            if k == 4:
+                cell = path.pop()
+                on_path[cell] = 0
+                best = frame_best.pop()
+                f_min = frame_min.pop()
+                order.pop()
+                next_move.pop()
+                slot = find(cell)
+                if slot >= 0:
+                    table_move[slot] = best
+                if not path:
+                    next_bound = f_min
+                elif f_min < frame_min[-1]:
+                    frame_min[-1] = f_min
+                    frame_best[-1] = order[-1][next_move[-1] - 1]
+                continue
+            next_move[depth] = k + 1
+            move = order[depth][k]
+            nxt = path[depth] + offsets[move]
+            if cells[nxt] != OPEN or on_path[nxt]:
+                continue
+            iterations += 1
+            f = depth + 1 + heuristic(nxt)
+            if f > bound:
+                if f < frame_min[depth]:
+                    frame_min[depth] = f
+                    frame_best[depth] = move
+                continue
+            if nxt == goal:
+                path.append(nxt)
+                for cell in path:
+                    on_path[cell] = 0
+                max_memory = max(max_memory, len(path))
+                return ([maze.position(cell) for cell in path], iterations, time.time() - start_time,
+                        max_memory, re_expansions)
+            best = probe(nxt, depth + 1)
+            if best is None:
+                continue
+            if expanded[nxt]:
+                re_expansions += 1
+            expanded[nxt] = 1
+            path.append(nxt)
+            order.append(MOVE_ORDERS[best])
+            next_move.append(0)
+            frame_min.append(inf)
+            frame_best.append(NO_MOVE)
+            on_path[nxt] = 1
+            max_memory = max(max_memory, len(path))
+            if iterations & 0xFFFF == 0 and time.time() - start_time > timeout:
+                for cell in path:
+                    on_path[cell] = 0
+                print("IDA*+TT timed out after", timeout, "seconds")
+                return None, iterations, time.time() - start_time, max_memory, re_expansions
+        if next_bound == inf:
+            return None, iterations, time.time() - start_time, max_memory, re_expansions
+        bound = next_bound
+
+ALGORITHMS = {
+    'RBFS': lambda grid, start_pos, goal_pos, memory_limit, timeout, memory_bytes:
+        rbfs(grid, start_pos, goal_pos, timeout),
+    'SMA*': sma_star,
+    'IDA*': lambda grid, start_pos, goal_pos, memory_limit, timeout, memory_bytes:
+        ida_star(grid, start_pos, goal_pos, timeout),
+    'IDA*+TT': lambda grid, start_pos, goal_pos, memory_limit, timeout, memory_bytes:
+        ida_star_tt(grid, start_pos, goal_pos, timeout=timeout),
+}
+
+# Experiment framework
+def run_experiments(maze_sizes=((10, 10), (20, 20), (30, 30)), num_trials=5, memory_limit=100,
+                    algorithms=('RBFS', 'SMA*', 'IDA*', 'IDA*+TT'), timeout=30, memory_bytes=None):
+    results = []
+
+    for rows, cols in maze_sizes:
+        size_results = {'size': f'{rows}x{cols}'}
+        size_results.update({algo: [] for algo in algorithms})
+        for _ in range(num_trials):
+            grid, start_pos, goal_pos = generate_maze(rows, cols)
+            for algo in algorithms:
+                path, iterations, exec_time, memory, *extra = ALGORITHMS[algo](grid, start_pos, goal_pos,
+                                                                               memory_limit, timeout, memory_bytes)
+                size_results[algo].append({
+                    'iterations': iterations,
+                    'time': exec_time,
+                    'path_length': len(path) if path else None,
+                    'memory': memory,
+                    're_expansions': extra[0] if extra else None
+                })
+
+        results.append(size_results)
+
+    # Print results
+    print("\nExperiment Results:")
+    for size_result in results:
+        print(f"\nMaze Size: {size_result['size']}")
+        for algo in algorithms:
+            avg_iterations = sum(r['iterations'] for r in size_result[algo]) / num_trials
+            avg_time = sum(r['time'] for r in size_result[algo]) / num_trials
+            valid_paths = [r['path_length'] for r in size_result[algo] if r['path_length'] is not None]
+            avg_path_length = sum(valid_paths) / len(valid_paths) if valid_paths else None
+            avg_memory = sum(r['memory'] for r in size_result[algo]) / num_trials
+            print(f"{algo}:")
+            print(f"  Avg Iterations: {avg_iterations:.2f}")
+            print(f"  Avg Execution Time: {avg_time:.4f} s")
+            print(f"  Avg Path Length: {avg_path_length:.2f}" if avg_path_length else "  Avg Path Length: None")
+            unit = 'bytes' if algo == 'SMA*' and memory_bytes is not None else 'nodes'
+            print(f"  Avg Max Memory: {avg_memory:.2f} {unit}")
+            if size_result[algo][0]['re_expansions'] is not None:
+                avg_re_expansions = sum(r['re_expansions'] for r in size_result[algo]) / num_trials
+                print(f"  Avg Re-expansions: {avg_re_expansions:.2f}")
+    return results
+
+if __name__ == "__main__":
+    # Set random seed for reproducibility
+    random.seed(42)
+    # Run experiments
+    run_experiments()
+    run_experiments(algorithms=('SMA*',), memory_bytes=64 * 1024)
+    run_experiments(maze_sizes=((1000, 1000),), num_trials=1, algorithms=('RBFS', 'IDA*', 'IDA*+TT'), timeout=10)
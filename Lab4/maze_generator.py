@@ -0,0 +1,263 @@
+import mmap
+import random
+import struct
+import sys
+import time
+import weakref
+
+# Maze grids and seeded maze generation.
+#
+# A maze is stored as one flat byte grid (1 = wall, 0 = open) with a wall
+# border around it, so the four neighbors of cell i are always i + offset
+# for the precomputed offsets (-width, +width, -1, +1) and never need a
+# bounds check. The generators carve a perfect maze on the lattice of cells
+# with even (row, col); passages open the wall cell between two lattice
+# cells. Every lattice cell is open, so start and goal are drawn from the
+# lattice directly instead of scanning the grid for open cells.
+
+WALL = 1
+OPEN = 0
+
+class Maze:
+    __slots__ = ('rows', 'cols', 'width', 'cells', 'offsets')
+
+    def __init__(self, rows, cols, cells=None):
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.cells = bytearray([WALL]) * (self.width * (rows + 2)) if cells is None else cells
+        self.offsets = (-self.width, self.width, -1, 1)
+
+    @classmethod
+    def from_rows(cls, grid):
+        maze = cls(len(grid), len(grid[0]))
+        for r, row in enumerate(grid):
+            start = maze.index((r, 0))
+            maze.cells[start:start + maze.cols] = bytes(row)
+        return maze
+
+    def index(self, pos):
+        return (pos[0] + 1) * self.width + pos[1] + 1
+
+    def position(self, i):
+        r, c = divmod(i, self.width)
+        return r - 1, c - 1
+
+    def is_open(self, pos):
+        return self.cells[self.index(pos)] == OPEN
+
+    def open_cells(self):
+        return [self.position(i) for i, cell in enumerate(self.cells) if cell == OPEN]
+
+    def to_rows(self):
+        return [list(self.cells[self.index((r, 0)):self.index((r, 0)) + self.cols]) for r in range(self.rows)]
+
+# Lattice cell k = i * lattice_cols + j is grid cell (2i, 2j)
+class Lattice:
+    __slots__ = ('maze', 'rows', 'cols')
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.rows = (maze.rows + 1) // 2
+        self.cols = (maze.cols + 1) // 2
+
+    def size(self):
+        return self.rows * self.cols
+
+    def cell(self, k):
+        i, j = divmod(k, self.cols)
+        return (2 * i + 1) * self.maze.width + 2 * j + 1
+
+    def position(self, k):
+        i, j = divmod(k, self.cols)
+        return 2 * i, 2 * j
+
+    def neighbors(self, k):
+        i, j = divmod(k, self.cols)
+        result = []
+        if i > 0:
+            result.append(k - self.cols)
+        if i < self.rows - 1:
+            result.append(k + self.cols)
+        if j > 0:
+            result.append(k - 1)
+        if j < self.cols - 1:
+            result.append(k + 1)
+        return result
+
+    def carve(self, k, n):
+        a, b = self.cell(k), self.cell(n)
+        cells = self.maze.cells
+        cells[a] = OPEN
+        cells[(a + b) // 2] = OPEN
+        cells[b] = OPEN
+
+# Recursive backtracker on an explicit stack: long corridors, few branches
+def carve_backtracker(lattice, rng):
+    visited = bytearray(lattice.size())
+    start = rng.randrange(lattice.size())
+    visited[start] = 1
+    lattice.maze.cells[lattice.cell(start)] = OPEN
+    stack = [start]
+    while stack:
+        k = stack[-1]
+        unvisited = [n for n in lattice.neighbors(k) if not visited[n]]
+        if not unvisited:
+            stack.pop()
+            continue
+        n = rng.choice(unvisited)
+        lattice.carve(k, n)
+        visited[n] = 1
+        stack.append(n)
+
+# Randomized Prim: grow the maze from a random frontier cell each step,
+# joined to one of its carved neighbors; many short dead ends
+def carve_prim(lattice, rng):
+    in_maze = bytearray(lattice.size())
+    in_frontier = bytearray(lattice.size())
+    start = rng.randrange(lattice.size())
+    in_maze[start] = 1
+    lattice.maze.cells[lattice.cell(start)] = OPEN
+    frontier = lattice.neighbors(start)
+    for n in frontier:
+        in_frontier[n] = 1
+    while frontier:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        k = frontier.pop()
+        neighbors = lattice.neighbors(k)
+        lattice.carve(k, rng.choice([n for n in neighbors if in_maze[n]]))
+        in_maze[k] = 1
+        for n in neighbors:
+            if not in_maze[n] and not in_frontier[n]:
+                in_frontier[n] = 1
+                frontier.append(n)
+
+# Wilson: loop-erased random walks from each cell not yet in the maze until
+# the walk hits the maze, which gives a uniformly random spanning tree. Only
+# the last exit of each cell is kept (next_cell), so loops erase themselves.
+# The first walks have to find a single cell, so this is the slowest of the
+# three on large grids.
+def carve_wilson(lattice, rng):
+    size = lattice.size()
+    in_maze = bytearray(size)
+    next_cell = [0] * size
+    root = rng.randrange(size)
+    in_maze[root] = 1
+    lattice.maze.cells[lattice.cell(root)] = OPEN
+    for k in range(size):
+        cell = k
+        while not in_maze[cell]:
+            n = rng.choice(lattice.neighbors(cell))
+            next_cell[cell] = n
+            cell = n
+        cell = k
+        while not in_maze[cell]:
+            in_maze[cell] = 1
+            lattice.carve(cell, next_cell[cell])
+            cell = next_cell[cell]
+
+GENERATORS = {
+    'backtracker': carve_backtracker,
+    'prim': carve_prim,
+    'wilson': carve_wilson,
+}
+
+# Perfect maze with random start and goal lattice cells. With a seed, the
+# maze depends only on (rows, cols, algorithm, seed); without one, the
+# global random module is used (so random.seed() applies).
+def generate_maze(rows, cols, algorithm='backtracker', seed=None):
+    rng = random if seed is None else random.Random(seed)
+    maze = Maze(rows, cols)
+    lattice = Lattice(maze)
+    GENERATORS[algorithm](lattice, rng)
+    start, goal = rng.sample(range(lattice.size()), 2)
+    return maze, lattice.position(start), lattice.position(goal)
+
+# Maze corpus file: a header (magic, version, rows, cols, count) followed by
+# count fixed-size records, each the start and goal cell indices and the
+# bordered grid bytes exactly as Maze.cells holds them. Record k starts at
+# HEADER.size + k * record size, so a corpus is memory-mapped and each maze
+# is a zero-copy view into the file.
+MAGIC = b'MAZE'
+VERSION = 1
+HEADER = struct.Struct('<4sIIII')
+RECORD_HEADER = struct.Struct('<II')
+
+def record_size(rows, cols):
+    return RECORD_HEADER.size + (rows + 2) * (cols + 2)
+
+# Write mazes (an iterable of (maze, start_pos, goal_pos), all of one size)
+# as they come; the count in the header is filled in at the end.
+def write_mazes(path, mazes, rows, cols):
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, rows, cols, 0))
+        for maze, start_pos, goal_pos in mazes:
+            if (maze.rows, maze.cols) != (rows, cols):
+                raise ValueError(f"maze is {maze.rows}x{maze.cols}, corpus is {rows}x{cols}")
+            f.write(RECORD_HEADER.pack(maze.index(start_pos), maze.index(goal_pos)))
+            f.write(maze.cells)
+            count += 1
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, rows, cols, count))
+    return count
+
+# Maze k of the corpus is generated with seed + k, so any single maze can
+# be regenerated without the file.
+def generate_corpus(path, rows, cols, count, algorithm='backtracker', seed=0):
+    mazes = (generate_maze(rows, cols, algorithm, seed + k) for k in range(count))
+    return write_mazes(path, mazes, rows, cols)
+
+class MazeFile:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.cols, self.count = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} maze corpus")
+        self.record_size = record_size(self.rows, self.cols)
+        self.view = memoryview(self.mmap)
+        self.views = weakref.WeakSet()  # views still held by callers
+
+    def __len__(self):
+        return self.count
+
+    # (maze, start_pos, goal_pos); maze.cells is a read-only view of the file.
+    # close() releases every view handed out, so mazes still held after it
+    # raise ValueError when their cells are read (copy them to keep them).
+    def __getitem__(self, k):
+        if not 0 <= k < self.count:
+            raise IndexError(k)
+        offset = HEADER.size + k * self.record_size
+        start, goal = RECORD_HEADER.unpack_from(self.mmap, offset)
+        cells = self.view[offset + RECORD_HEADER.size:offset + self.record_size]
+        self.views.add(cells)
+        maze = Maze(self.rows, self.cols, cells)
+        return maze, maze.position(start), maze.position(goal)
+
+    def __iter__(self):
+        return (self[k] for k in range(self.count))
+
+    def close(self):
+        for view in list(getattr(self, 'views', ())):
+            view.release()
+        if hasattr(self, 'view'):
+            self.view.release()
+        self.mmap.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+if __name__ == "__main__":
+    rows, cols = (int(arg) for arg in sys.argv[1:3]) if len(sys.argv) > 2 else (1000, 1000)
+    for algorithm in GENERATORS:
+        start_time = time.time()
+        maze, start_pos, goal_pos = generate_maze(rows, cols, algorithm, seed=42)
+        print(f"{algorithm}: {rows}x{cols} in {time.time() - start_time:.2f} s, "
+              f"start {start_pos}, goal {goal_pos}")
@@ -1,96 +1,351 @@
 import random
 import time
 import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import matplotlib.pyplot as plt
 import numpy as np
+from sweep_store import SweepStore
+
+# Sentinel delta for "moves" that leave a queen on its current row
+NO_MOVE = np.iinfo(np.int64).max // 4
+
+# Board state with row and diagonal occupancy counters
+# Every pair of queens sharing a row or diagonal counts as one conflict,
+# so the total is the sum of k*(k-1)/2 over all counters.
+class BoardState:
+    def __init__(self, state):
+        self.n = n = len(state)
+        self.state = list(state)
+        rows = np.asarray(self.state, dtype=np.int64)
+        cols = np.arange(n, dtype=np.int64)
+        self.rows = np.bincount(rows, minlength=n)
+        self.diag1 = np.bincount(rows + cols, minlength=2 * n - 1)  # row + col
+        self.diag2 = np.bincount(rows - cols + n - 1, minlength=2 * n - 1)  # row - col
+        self.conflicts = int(sum((c * (c - 1) // 2).sum() for c in (self.rows, self.diag1, self.diag2)))
+
+    def copy(self):
+        other = BoardState.__new__(BoardState)
+        other.n = self.n
+        other.state = self.state.copy()
+        other.rows = self.rows.copy()
+        other.diag1 = self.diag1.copy()
+        other.diag2 = self.diag2.copy()
+        other.conflicts = self.conflicts
+        return other
+
+    # Queens attacking (row, col), counting the queen itself if it stands there
+    def attacks(self, col, row):
+        return int(self.rows[row] + self.diag1[row + col] + self.diag2[row - col + self.n - 1])
+
+    # Change in conflicts if the queen of column col moves to row, in O(1)
+    def delta(self, col, row):
+        current = self.state[col]
+        if row == current:
+            return 0
+        return self.attacks(col, row) - (self.attacks(col, current) - 3)
+
+    # Move the queen of column col to row, in O(1)
+    def move(self, col, row):
+        current = self.state[col]
+        if row == current:
+            return
+        self.conflicts += self.delta(col, row)
+        n = self.n
+        self.rows[current] -= 1
+        self.diag1[current + col] -= 1
+        self.diag2[current - col + n - 1] -= 1
+        self.rows[row] += 1
+        self.diag1[row + col] += 1
+        self.diag2[row - col + n - 1] += 1
+        self.state[col] = row
+
+    # n x n matrix of deltas for every single-queen move, indexed [col, row]
+    # Entries for a queen's current row hold NO_MOVE.
+    def move_deltas(self):
+        n = self.n
+        cols = np.arange(n)
+        current = np.asarray(self.state)
+        add = self.rows[None, :] + self.diag1[cols[:, None] + cols[None, :]] \
+            + self.diag2[cols[None, :] - cols[:, None] + n - 1]
+        remove = self.rows[current] + self.diag1[current + cols] + self.diag2[current - cols + n - 1] - 3
+        deltas = add - remove[:, None]
+        deltas[cols, current] = NO_MOVE
+        return deltas
 
 # Helper function to calculate conflicts
+# One pass with plain counters: each queen conflicts with the queens already
+# counted on its row and diagonals. Cheaper than a BoardState when the
+# board is only scored once.
 def calculate_conflicts(state):
     n = len(state)
+    rows = [0] * n
+    diag1 = [0] * (2 * n - 1)
+    diag2 = [0] * (2 * n - 1)
     conflicts = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            if state[i] == state[j]:  # Same row
-                conflicts += 1
-            if abs(state[i] - state[j]) == abs(i - j):  # Same diagonal
-                conflicts += 1
+    for col, row in enumerate(state):
+        conflicts += rows[row] + diag1[row + col] + diag2[row - col + n - 1]
+        rows[row] += 1
+        diag1[row + col] += 1
+        diag2[row - col + n - 1] += 1
     return conflicts
 
+# Histogram of each row of a 2-D array of line indices (rows or
+# diagonals), one histogram row of width 2n-1 per individual
+def line_histogram(lines):
+    size, n = lines.shape
+    width = 2 * n - 1
+    offsets = (np.arange(size) * width)[:, None]
+    return np.bincount((lines + offsets).ravel(), minlength=size * width).reshape(size, width)
+
+# Conflicts of every row of a 2-D population array, from per-individual
+# row and diagonal histograms (row conflicts are skipped for permutations)
+def population_conflicts(population, permutation=False):
+    n = population.shape[1]
+    cols = np.arange(n)
+    lines = [population + cols, population - cols + n - 1]
+    if not permutation:
+        lines.append(population)
+    conflicts = np.zeros(len(population), dtype=np.int64)
+    for line in lines:
+        counts = line_histogram(line)
+        conflicts += (counts * (counts - 1) // 2).sum(axis=1)
+    return conflicts
+
+# Conflicts after every single-queen move of every state in beams, as a
+# (states, n, n) array indexed [state, col, row]; staying put is NO_MOVE
+def neighbor_conflicts(beams, conflicts):
+    size, n = beams.shape
+    cols = np.arange(n)
+    rows = line_histogram(beams)
+    diag1 = line_histogram(beams + cols)
+    diag2 = line_histogram(beams - cols + n - 1)
+    add = rows[:, None, :n] + diag1[:, cols[:, None] + cols[None, :]] \
+        + diag2[:, cols[None, :] - cols[:, None] + n - 1]
+    remove = np.take_along_axis(rows, beams, axis=1) + np.take_along_axis(diag1, beams + cols, axis=1) \
+        + np.take_along_axis(diag2, beams - cols + n - 1, axis=1) - 3
+    scores = conflicts[:, None, None] + add - remove[:, :, None]
+    scores[np.arange(size)[:, None], cols[None, :], beams] = NO_MOVE
+    return scores
+
 # Hill Climbing
-def hill_climbing(n, max_steps=1000):
+# The local searches take hooks=None (see search_hooks.py at the repository
+# root): they emit expand once per step with the current conflicts (best
+# conflicts for the population searches) and time their scoring functions.
+def hill_climbing(n, max_steps=1000, hooks=None):
     state = [random.randint(0, n-1) for _ in range(n)]
+    board = BoardState(state)
+    move_deltas = board.move_deltas if hooks is None else hooks.timed('move_deltas', board.move_deltas)
     steps = 0
     while steps < max_steps:
-        current_conflicts = calculate_conflicts(state)
-        if current_conflicts == 0:
-            return state, steps, True
-        neighbors = []
-        for col in range(n):
-            for row in range(n):
-                if row != state[col]:
-                    neighbor = state.copy()
-                    neighbor[col] = row
-                    neighbors.append((neighbor, calculate_conflicts(neighbor)))
-        neighbors.sort(key=lambda x: x[1])
-        if neighbors[0][1] >= current_conflicts:
-            return state, steps, False
-        state = neighbors[0][0]
+        if hooks is not None:
+            hooks.emit('expand', board.conflicts)
+        if board.conflicts == 0:
+            return board.state, steps, True
+        deltas = move_deltas()
+        col, row = divmod(int(np.argmin(deltas)), n)
+        if deltas[col, row] >= 0:
+            return board.state, steps, False
+        board.move(col, row)
         steps += 1
-    return state, steps, False
+    return board.state, steps, False
 
 # Beam Search
-def beam_search(n, k=3, max_steps=1000):
+# All k*n*(n-1) moves are scored in one vectorized pass, a chunk of beam
+# states at a time so that at most chunk_cells scores are held at once.
+# A partial top-k (argpartition) replaces the full sort, and children that
+# repeat a state already in the new beam are skipped.
+def beam_search(n, k=3, max_steps=1000, chunk_cells=1 << 20, hooks=None):
+    score_beams = population_conflicts if hooks is None else hooks.timed('population_conflicts', population_conflicts)
+    score_moves = neighbor_conflicts if hooks is None else hooks.timed('neighbor_conflicts', neighbor_conflicts)
     states = [[random.randint(0, n-1) for _ in range(n)] for _ in range(k)]
+    _, first = np.unique(np.array(states), axis=0, return_index=True)
+    beams = np.array(states)[np.sort(first)]
+    moves = n * n
+    chunk = max(1, chunk_cells // moves)
+    keep = 2 * k  # spare candidates in case some are duplicates
     steps = 0
     while steps < max_steps:
-        for state in states:
-            if calculate_conflicts(state) == 0:
-                return state, steps, True
-        neighbors = []
-        for state in states:
-            for col in range(n):
-                for row in range(n):
-                    if row != state[col]:
-                        neighbor = state.copy()
-                        neighbor[col] = row
-                        neighbors.append((neighbor, calculate_conflicts(neighbor)))
-        neighbors.sort(key=lambda x: x[1])
-        states = [neighbor[0] for neighbor in neighbors[:k]]
+        conflicts = score_beams(beams)
+        if hooks is not None:
+            hooks.emit('expand', int(conflicts.min()))
+        if (conflicts == 0).any():
+            return beams[int(np.argmin(conflicts))].tolist(), steps, True
+        best_scores = np.empty(0, dtype=np.int64)
+        best_moves = np.empty(0, dtype=np.int64)
+        for start in range(0, len(beams), chunk):
+            scores = score_moves(beams[start:start + chunk], conflicts[start:start + chunk]).ravel()
+            if len(scores) > keep:
+                top = np.argpartition(scores, keep - 1)[:keep]
+            else:
+                top = np.arange(len(scores))
+            best_scores = np.concatenate([best_scores, scores[top]])
+            best_moves = np.concatenate([best_moves, top + start * moves])
+            if len(best_scores) > keep:
+                top = np.argpartition(best_scores, keep - 1)[:keep]
+                best_scores, best_moves = best_scores[top], best_moves[top]
+        new_beams, seen = [], set()
+        for i in np.lexsort((best_moves, best_scores)):
+            if best_scores[i] >= NO_MOVE or len(new_beams) == k:
+                break
+            b, move = divmod(int(best_moves[i]), moves)
+            col, row = divmod(move, n)
+            child = beams[b].copy()
+            child[col] = row
+            key = child.tobytes()
+            if key not in seen:
+                seen.add(key)
+                new_beams.append(child)
+        beams = np.array(new_beams)
         steps += 1
-    best_state = min(states, key=calculate_conflicts)
-    return best_state, steps, calculate_conflicts(best_state) == 0
+    conflicts = population_conflicts(beams)
+    best = int(np.argmin(conflicts))
+    return beams[best].tolist(), steps, bool(conflicts[best] == 0)
 
 # Simulated Annealing
-def simulated_annealing(n, initial_temp=1000, cooling_rate=0.995, max_steps=1000):
+# A rejected move is reported to hooks as prune (with its delta)
+def simulated_annealing(n, initial_temp=1000, cooling_rate=0.995, max_steps=1000, hooks=None):
     state = [random.randint(0, n-1) for _ in range(n)]
+    board = BoardState(state)
+    delta_of = board.delta if hooks is None else hooks.timed('delta', board.delta)
     temp = initial_temp
     steps = 0
     while steps < max_steps and temp > 0.1:
-        current_conflicts = calculate_conflicts(state)
-        if current_conflicts == 0:
-            return state, steps, True
+        if hooks is not None:
+            hooks.emit('expand', board.conflicts)
+        if board.conflicts == 0:
+            return board.state, steps, True
         col = random.randint(0, n-1)
         row = random.randint(0, n-1)
-        while row == state[col]:
+        while row == board.state[col]:
             row = random.randint(0, n-1)
-        neighbor = state.copy()
-        neighbor[col] = row
-        neighbor_conflicts = calculate_conflicts(neighbor)
-        delta = neighbor_conflicts - current_conflicts
+        delta = delta_of(col, row)
         if delta <= 0 or random.random() < math.exp(-delta / temp):
-            state = neighbor
+            board.move(col, row)
+        elif hooks is not None:
+            hooks.emit('prune', delta)
         temp *= cooling_rate
         steps += 1
-    return state, steps, calculate_conflicts(state) == 0
+    return board.state, steps, board.conflicts == 0
+
+# Parallel Tempering (replica-exchange simulated annealing)
+# chains annealing chains run together on one (chains, n) array of row
+# permutations, so only diagonals can conflict and a move swaps the rows of
+# two queens. Chain c runs at ladder[rung[c]] * scale, with the ladder
+# geometric from t_min to t_max. Each step proposes one swap per chain and
+# scores all of them at once from flat per-chain diagonal counters (chain c
+# owns entries c*(2n-1) to (c+1)*(2n-1)); random numbers are drawn block
+# steps at a time. Every swap_every steps, neighboring rungs exchange
+# temperatures with the replica-exchange acceptance rule, alternating even
+# and odd pairs. scale starts at 1: the chains start cold, which finds
+# near-solutions fastest. When the best chain has not improved for patience
+# steps, scale is set to reheat (reported to hooks as restart) and cools
+# back to 1 by cooling_rate per step. The search stops as soon as any
+# chain has no conflicts, after max_steps, or after time_limit seconds of
+# CPU time.
+def parallel_tempering(n, chains=32, t_min=0.1, t_max=1.0, swap_every=10, reheat=2.0, cooling_rate=0.999,
+                       patience=5000, max_steps=1000000, time_limit=None, block=256, hooks=None):
+    rng = np.random.default_rng(random.getrandbits(64))
+    width = 2 * n - 1
+    chain = np.arange(chains)
+    base = chain * width  # row + col counters of each chain
+    off = base + n - 1  # row - col counters of each chain
+    first = chain * n  # columns of each chain in state
+    population = np.argsort(rng.random((chains, n)), axis=1)
+    cols = np.arange(n)
+    diag1 = np.bincount((population + cols + base[:, None]).ravel(), minlength=chains * width)
+    diag2 = np.bincount((population - cols + off[:, None]).ravel(), minlength=chains * width)
+    state = population.ravel()
+    conflicts = (diag1 * (diag1 - 1) // 2).reshape(chains, width).sum(axis=1) \
+        + (diag2 * (diag2 - 1) // 2).reshape(chains, width).sum(axis=1)
+
+    ladder = t_min * (t_max / t_min) ** (chain / max(chains - 1, 1))
+    betas = 1 / ladder
+    rung = chain.copy()
+    scale = 1.0
+
+    # Swap temperatures of neighboring rungs (even pairs, or odd pairs)
+    def exchange(parity):
+        order = np.argsort(rung)  # chain at each rung
+        low = np.arange(parity, chains - 1, 2)
+        i, j = order[low], order[low + 1]
+        x = (betas[low] - betas[low + 1]) / scale * (conflicts[i] - conflicts[j])
+        swap = np.log(rng.random(len(low))) < x
+        rung[i[swap]], rung[j[swap]] = low[swap] + 1, low[swap]
+    if hooks is not None:
+        exchange = hooks.timed('exchange', exchange)
+
+    best, stalled = int(conflicts.min()), 0
+    start_time = time.process_time()
+    steps = 0
+    while best > 0 and steps < max_steps:
+        k = steps % block
+        if k == 0:
+            if time_limit is not None and time.process_time() - start_time > time_limit:
+                break
+            col_a = rng.integers(0, n, (block, chains))
+            col_b = rng.integers(0, n - 1, (block, chains))
+            # accept a move when delta <= -temp * log(u), i.e. with
+            # probability exp(-delta / temp)
+            threshold = -np.log(rng.random((block, chains)))
+        a = col_a[k]
+        b = col_b[k]
+        b = b + (b >= a)
+        ra, rb = state[first + a], state[first + b]
+        # Change in conflicts of swapping the rows of columns a and b: the
+        # two queens leave their diagonals and join the other two; the
+        # last term corrects for the queens sharing a diagonal before or
+        # after the swap
+        delta = diag1[base + rb + a] + diag2[off + rb - a] + diag1[base + ra + b] + diag2[off + ra - b] \
+            - diag1[base + ra + a] - diag2[off + ra - a] - diag1[base + rb + b] - diag2[off + rb - b] + 4 \
+            + 2 * ((ra - rb == a - b) | (rb - ra == a - b))
+        moved = np.flatnonzero(delta <= ladder[rung] * scale * threshold[k])
+        if len(moved):
+            a, b, ra, rb = a[moved], b[moved], ra[moved], rb[moved]
+            d1, d2 = base[moved], off[moved]
+            # One counter update per chain at a time, so indices never repeat
+            diag1[d1 + ra + a] -= 1
+            diag2[d2 + ra - a] -= 1
+            diag1[d1 + rb + b] -= 1
+            diag2[d2 + rb - b] -= 1
+            diag1[d1 + rb + a] += 1
+            diag2[d2 + rb - a] += 1
+            diag1[d1 + ra + b] += 1
+            diag2[d2 + ra - b] += 1
+            state[first[moved] + a] = rb
+            state[first[moved] + b] = ra
+            conflicts[moved] += delta[moved]
+        steps += 1
+        current = int(conflicts.min())
+        if hooks is not None:
+            hooks.emit('expand', current)
+        if current < best:
+            best, stalled = current, 0
+        else:
+            stalled += 1
+            if stalled >= patience:
+                scale, stalled, best = reheat, 0, current
+                if hooks is not None:
+                    hooks.emit('restart', current)
+        scale = max(1.0, scale * cooling_rate)
+        if steps % swap_every == 0:
+            exchange(steps // swap_every % 2)
+    c = int(np.argmin(conflicts))
+    return population[c].tolist(), steps, bool(conflicts[c] == 0)
 
 # Genetic Algorithm
-def genetic_algorithm(n, pop_size=100, max_gen=1000, mutation_rate=0.1):
+def genetic_algorithm(n, pop_size=100, max_gen=1000, mutation_rate=0.1, hooks=None):
     def fitness(state):
         return -calculate_conflicts(state)
+    if hooks is not None:
+        fitness = hooks.timed('fitness', fitness)
     
     population = [[random.randint(0, n-1) for _ in range(n)] for _ in range(pop_size)]
     for gen in range(max_gen):
         population.sort(key=fitness, reverse=True)
+        if hooks is not None:
+            hooks.emit('expand', -fitness(population[0]))
         if fitness(population[0]) == 0:
             return population[0], gen, True
         new_population = population[:pop_size//2]
@@ -106,32 +361,219 @@ def genetic_algorithm(n, pop_size=100, max_gen=1000, mutation_rate=0.1):
     best_state = max(population, key=fitness)
     return best_state, max_gen, calculate_conflicts(best_state) == 0
 
+# Genetic Algorithm on a NumPy population array
+# Same scheme as genetic_algorithm (keep the best half, one-point crossover
+# between parents drawn from it, random mutation) done for the whole
+# population at once. With permutation=True individuals are row
+# permutations: crossover keeps the first parent's prefix and fills the
+# rest in the second parent's order, and mutation swaps two queens.
+def vectorized_genetic_algorithm(n, pop_size=100, max_gen=1000, mutation_rate=0.1, permutation=False, hooks=None):
+    score = population_conflicts if hooks is None else hooks.timed('population_conflicts', population_conflicts)
+    rng = np.random.default_rng(random.getrandbits(64))
+    if permutation:
+        population = np.argsort(rng.random((pop_size, n)), axis=1)
+    else:
+        population = rng.integers(0, n, size=(pop_size, n))
+    elite_size = pop_size // 2
+    n_children = pop_size - elite_size
+    cols = np.arange(n)
+    children_idx = np.arange(n_children)
+    for gen in range(max_gen):
+        conflicts = score(population, permutation)
+        order = np.argsort(conflicts, kind='stable')
+        if hooks is not None:
+            hooks.emit('expand', int(conflicts[order[0]]))
+        if conflicts[order[0]] == 0:
+            return population[order[0]].tolist(), gen, True
+        elite = population[order[:elite_size]]
+        parent1 = elite[rng.integers(0, elite_size, n_children)]
+        parent2 = elite[rng.integers(0, elite_size, n_children)]
+        points = rng.integers(1, n, n_children)[:, None] if n > 1 else np.ones((n_children, 1), dtype=np.int64)
+        if permutation:
+            pos1 = np.argsort(parent1, axis=1)
+            pos2 = np.argsort(parent2, axis=1)
+            keys = np.where(pos1 < points, pos1, points + pos2)
+            children = np.argsort(keys, axis=1)
+        else:
+            children = np.where(cols < points, parent1, parent2)
+        mutants = children_idx[rng.random(n_children) < mutation_rate]
+        if len(mutants):
+            col = rng.integers(0, n, len(mutants))
+            if permutation:
+                other = rng.integers(0, n, len(mutants))
+                children[mutants, col], children[mutants, other] = children[mutants, other], children[mutants, col]
+            else:
+                children[mutants, col] = rng.integers(0, n, len(mutants))
+        population = np.concatenate([elite, children])
+    conflicts = population_conflicts(population, permutation)
+    best = int(np.argmin(conflicts))
+    return population[best].tolist(), max_gen, bool(conflicts[best] == 0)
+
+# Min-Conflicts
+# The greedy start draws every queen from the rows still unused, so the
+# board is a row permutation and only diagonals can conflict. Repairs swap
+# the rows of two queens, which keeps that property: a conflicted queen is
+# swapped with whichever sampled partner leaves the fewest conflicts. With
+# probability noise, or when every swap would add conflicts, the partner is
+# random instead, so the search does not cycle on a plateau (small boards);
+# hooks see these random walk steps as restart events.
+# Diagonal counters live in flat C int arrays. conflicted indexes the
+# columns that may be in conflict; a column is only dropped once it is
+# checked and found conflict-free, so an empty index means a solution.
+def min_conflicts(n, max_steps=10000, init_tries=64, swap_tries=32, noise=0.05, hooks=None):
+    diag1 = array('i', bytes(4 * (2 * n - 1)))  # row + col
+    diag2 = array('i', bytes(4 * (2 * n - 1)))  # row - col + n - 1
+    state = array('i', bytes(4 * n))
+
+    # Greedy placement: draw unused rows at random and keep the first one
+    # that no earlier queen attacks (or the least attacked one)
+    free = array('i', range(n))
+    remaining = n
+    for col in range(n):
+        best_idx, best_attacks = 0, n
+        for _ in range(init_tries):
+            idx = int(random.random() * remaining)
+            row = free[idx]
+            attacks = diag1[row + col] + diag2[row - col + n - 1]
+            if attacks < best_attacks:
+                best_idx, best_attacks = idx, attacks
+                if attacks == 0:
+                    break
+        row = free[best_idx]
+        remaining -= 1
+        free[best_idx] = free[remaining]
+        state[col] = row
+        diag1[row + col] += 1
+        diag2[row - col + n - 1] += 1
+    del free
+
+    def in_conflict(col):
+        row = state[col]
+        return diag1[row + col] + diag2[row - col + n - 1] > 2
+
+    # Swap the rows of columns a and b, returning the change in conflicts
+    def swap(a, b):
+        ra, rb = state[a], state[b]
+        delta = 0
+        for col, row in ((a, ra), (b, rb)):
+            diag1[row + col] -= 1
+            diag2[row - col + n - 1] -= 1
+            delta -= diag1[row + col] + diag2[row - col + n - 1]
+        for col, row in ((a, rb), (b, ra)):
+            delta += diag1[row + col] + diag2[row - col + n - 1]
+            diag1[row + col] += 1
+            diag2[row - col + n - 1] += 1
+        state[a], state[b] = rb, ra
+        return delta
+
+    trial_swap = swap if hooks is None else hooks.timed('swap', swap)
+    conflicted = [col for col in range(n) if in_conflict(col)]
+    in_set = bytearray(n)
+    for col in conflicted:
+        in_set[col] = 1
+
+    steps = 0
+    while conflicted and steps < max_steps:
+        idx = int(random.random() * len(conflicted))
+        col = conflicted[idx]
+        conflicted[idx] = conflicted[-1]
+        conflicted.pop()
+        in_set[col] = 0
+        if not in_conflict(col):
+            continue
+        if hooks is not None:
+            hooks.emit('expand', len(conflicted) + 1)
+        if n - 1 <= swap_tries:
+            partners = [other for other in range(n) if other != col]
+        else:
+            partners = [int(random.random() * n) for _ in range(swap_tries)]
+        best_delta, best_partner = 1, None
+        for other in partners:
+            if other == col:
+                continue
+            delta = trial_swap(col, other)
+            swap(col, other)  # undo the trial swap
+            if delta < best_delta or (delta == best_delta and random.random() < 0.5):
+                best_delta, best_partner = delta, other
+        if best_partner is None or random.random() < noise:
+            # Random walk step: leaves local minima and plateaus
+            best_partner = partners[int(random.random() * len(partners))]
+            if hooks is not None:
+                hooks.emit('restart', len(conflicted) + 1)
+            if best_partner == col:
+                best_partner = None
+        if best_partner is not None:
+            swap(col, best_partner)
+            if in_conflict(best_partner) and not in_set[best_partner]:
+                in_set[best_partner] = 1
+                conflicted.append(best_partner)
+        if in_conflict(col):
+            in_set[col] = 1
+            conflicted.append(col)
+        steps += 1
+    return state.tolist(), steps, not conflicted
+
+# Solvers by name, as used in results
+SOLVERS = {
+    'hill_climbing': hill_climbing,
+    'beam_search': beam_search,
+    'simulated_annealing': simulated_annealing,
+    'parallel_tempering': parallel_tempering,
+    'genetic_algorithm': genetic_algorithm,
+    'vectorized_genetic_algorithm': vectorized_genetic_algorithm,
+    'min_conflicts': min_conflicts,
+}
+
+# Run a single trial with its own seed; CPU time is not inflated by
+# other trials running on the same machine. params are keyword arguments
+# for the solver (e.g. {'k': 10} for beam_search).
+def run_trial(algo, n, seed, params=None):
+    random.seed(seed)
+    start_time = time.process_time()
+    state, steps, success = SOLVERS[algo](n, **(params or {}))
+    elapsed = time.process_time() - start_time
+    return elapsed, success, calculate_conflicts(state) if not success else 0, steps
+
 # Run experiments
-def run_experiments(n_values, runs=20):
-    results = {
-        'hill_climbing': {'time': [], 'success': [], 'conflicts': [], 'iterations': []},
-        'beam_search': {'time': [], 'success': [], 'conflicts': [], 'iterations': []},
-        'simulated_annealing': {'time': [], 'success': [], 'conflicts': [], 'iterations': []},
-        'genetic_algorithm': {'time': [], 'success': [], 'conflicts': [], 'iterations': []}
-    }
-    
+# Run r of every (algorithm, N) is seeded with seed + r, so a sweep is
+# reproducible whether it runs in-process (workers=1) or on a process pool,
+# and adding N values or algorithms leaves the seeds of the others alone.
+# params maps algorithm names to solver parameters. With a store
+# (sweep_store.SweepStore), each trial is appended to it as it finishes,
+# trials already in it are skipped, and the averages are read back from it;
+# every plot_every new trials, plot_results is redrawn from the store.
+def run_experiments(n_values, runs=20, workers=1, seed=None, store=None, params=None, plot_every=None):
+    params = params or {}
+    if seed is None:
+        seed = 0 if store is not None else random.randrange(2**32)
+    trials = [(algo, n, seed + r) for n in n_values for algo in SOLVERS for r in range(runs)]
+    if store is not None:
+        trials = [(algo, n, s) for algo, n, s in trials if not store.has(algo, params.get(algo), n, s)]
+    done = {(algo, n): [] for n in n_values for algo in SOLVERS}
+
+    def finish(algo, n, trial_seed, result):
+        done[(algo, n)].append(result)
+        if store is not None:
+            store.append(algo, params.get(algo), n, trial_seed, result)
+            if plot_every and store.rows % plot_every == 0:
+                plot_results(n_values, store.summary(n_values, SOLVERS, params, range(seed, seed + runs)))
+
+    if workers == 1:
+        for algo, n, trial_seed in trials:
+            finish(algo, n, trial_seed, run_trial(algo, n, trial_seed, params.get(algo)))
+    else:
+        # Stream trials back as they finish, in whatever order that is
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run_trial, *trial, params.get(trial[0])): trial for trial in trials}
+            for future in as_completed(futures):
+                finish(*futures[future], future.result())
+
+    if store is not None:
+        return store.summary(n_values, SOLVERS, params, range(seed, seed + runs))
+    results = {algo: {'time': [], 'success': [], 'conflicts': [], 'iterations': []} for algo in SOLVERS}
     for n in n_values:
         for algo in results:
-            times, successes, conflicts, iterations = [], [], [], []
-            for _ in range(runs):
-                start_time = time.time()
-                if algo == 'hill_climbing':
-                    state, steps, success = hill_climbing(n)
-                elif algo == 'beam_search':
-                    state, steps, success = beam_search(n)
-                elif algo == 'simulated_annealing':
-                    state, steps, success = simulated_annealing(n)
-                else:
-                    state, steps, success = genetic_algorithm(n)
-                times.append(time.time() - start_time)
-                successes.append(success)
-                conflicts.append(calculate_conflicts(state) if not success else 0)
-                iterations.append(steps)
+            times, successes, conflicts, iterations = zip(*done[(algo, n)])
             results[algo]['time'].append(sum(times) / runs)
             results[algo]['success'].append(sum(successes) / runs * 100)
             results[algo]['conflicts'].append(sum(conflicts) / runs)
@@ -181,9 +623,13 @@ def plot_results(n_values, results):
     
     plt.tight_layout()
     plt.savefig('n_queens_results.png')
+    plt.close()
 
 # Example usage
 if __name__ == "__main__":
     n_values = [8, 16]
-    results = run_experiments(n_values)
+    # Trials are kept in n_queens_sweep/ next to this script (ignored by
+    # git), so a rerun (or a wider n_values) only runs the missing trials
+    with SweepStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'n_queens_sweep')) as store:
+        results = run_experiments(n_values, workers=os.cpu_count(), store=store)
     plot_results(n_values, results)
\ No newline at end of file
@@ -0,0 +1,127 @@
+import json
+import math
+import os
+import numpy as np
+
+# On-disk store of experiment trials, one raw little-endian file per column.
+#
+# A trial is keyed by (config, n, seed), where a config is an algorithm name
+# plus its keyword parameters. Configs are numbered in configs.jsonl (one
+# JSON line [algorithm, params] per config, line k being config k), so the
+# columns hold only fixed-size numbers. Trials are appended and flushed as
+# they finish, so a sweep that is interrupted keeps every finished trial.
+# A crash in the middle of an append can leave some columns one row longer
+# than others; opening the store cuts them all back to the shortest.
+
+COLUMNS = {
+    'config': np.dtype('<u4'),
+    'n': np.dtype('<u4'),
+    'seed': np.dtype('<u8'),
+    'time': np.dtype('<f8'),
+    'success': np.dtype('u1'),
+    'conflicts': np.dtype('<i8'),
+    'iterations': np.dtype('<i8'),
+}
+
+# Params as a canonical JSON string, so equal dicts give equal keys
+def config_key(algo, params=None):
+    return json.dumps([algo, params or {}], sort_keys=True)
+
+class SweepStore:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.configs = []
+        self.config_ids = {}
+        configs_path = os.path.join(path, 'configs.jsonl')
+        if os.path.exists(configs_path):
+            with open(configs_path, 'r+b') as f:
+                data = f.read()
+                # Drop a last line cut short by a crash
+                f.truncate(data.rfind(b'\n') + 1)
+            for line in data[:data.rfind(b'\n') + 1].splitlines():
+                algo, params = json.loads(line)
+                self.config_ids[config_key(algo, params)] = len(self.configs)
+                self.configs.append((algo, params))
+        self.configs_file = open(configs_path, 'a')
+
+        files = {name: os.path.join(path, name + '.bin') for name in COLUMNS}
+        sizes = [os.path.getsize(f) // COLUMNS[name].itemsize if os.path.exists(f) else 0
+                 for name, f in files.items()]
+        self.rows = min(sizes)
+        self.files = {}
+        for name, f in files.items():
+            handle = open(f, 'ab')
+            handle.truncate(self.rows * COLUMNS[name].itemsize)
+            self.files[name] = handle
+        columns = self.columns()
+        self.done = set(zip(columns['config'].tolist(), columns['n'].tolist(), columns['seed'].tolist()))
+
+    def config_id(self, algo, params=None):
+        key = config_key(algo, params)
+        if key not in self.config_ids:
+            self.config_ids[key] = len(self.configs)
+            self.configs.append(tuple(json.loads(key)))
+            self.configs_file.write(key + '\n')
+            self.configs_file.flush()
+        return self.config_ids[key]
+
+    def has(self, algo, params, n, seed):
+        key = config_key(algo, params)
+        return key in self.config_ids and (self.config_ids[key], n, seed) in self.done
+
+    # result is the (time, success, conflicts, iterations) tuple of run_trial
+    def append(self, algo, params, n, seed, result):
+        config = self.config_id(algo, params)
+        row = (config, n, seed) + tuple(result)
+        for (name, dtype), value in zip(COLUMNS.items(), row):
+            self.files[name].write(np.array(value, dtype=dtype).tobytes())
+        for handle in self.files.values():
+            handle.flush()
+        self.rows += 1
+        self.done.add((config, n, seed))
+
+    # Every column as a NumPy array (read from disk, so other processes'
+    # appends are seen after a reopen)
+    def columns(self):
+        result = {}
+        for name, dtype in COLUMNS.items():
+            self.files[name].flush()
+            result[name] = np.fromfile(os.path.join(self.path, name + '.bin'), dtype=dtype, count=self.rows)
+        return result
+
+    # Averages over the stored trials of one config per algorithm, in the
+    # results layout of run_experiments: lists aligned with n_values, NaN
+    # where no trial is stored yet. params maps algorithm names to their
+    # parameters (none by default). Only the trials of the given seeds are
+    # used when seeds is not None.
+    def summary(self, n_values, algos, params=None, seeds=None):
+        params = params or {}
+        columns = self.columns()
+        selected = np.ones(self.rows, dtype=bool)
+        if seeds is not None:
+            selected &= np.isin(columns['seed'], np.asarray(list(seeds), dtype=np.uint64))
+        results = {}
+        for algo in algos:
+            config = self.config_ids.get(config_key(algo, params.get(algo)))
+            stats = {'time': [], 'success': [], 'conflicts': [], 'iterations': []}
+            for n in n_values:
+                rows = selected & (columns['n'] == n) & (columns['config'] == config) \
+                    if config is not None else np.zeros(self.rows, dtype=bool)
+                for name, column in stats.items():
+                    values = columns[name][rows]
+                    mean = float(values.mean()) if len(values) else math.nan
+                    column.append(mean * 100 if name == 'success' else mean)
+            results[algo] = stats
+        return results
+
+    def close(self):
+        self.configs_file.close()
+        for handle in self.files.values():
+            handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
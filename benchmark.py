@@ -0,0 +1,273 @@
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+# One benchmark harness for the solvers of every lab.
+#
+# A case is a name, a setup function and a node counter: setup() builds the
+# problem once and returns a zero-argument run(); nodes(result) reads the
+# number of nodes (states explored, iterations, steps) from what run()
+# returns, or gives None when the solver does not count them. Solvers that
+# labs keep in a registry (ALGORITHMS, SOLVERS) are picked up from it, so a
+# new entry there is benchmarked without touching this file.
+#
+# Every run starts from the same seed. After warmup runs, each trial is
+# timed with perf_counter_ns (wall) and process_time_ns (CPU) with the
+# garbage collector off, like timeit. Memory is measured in a separate,
+# untimed run under tracemalloc, so its overhead never shows in the times.
+# Results are saved as JSON; --compare flags cases whose median wall time
+# moved by more than --threshold against a saved run.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def load(lab, module):
+    path = os.path.join(ROOT, lab)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return importlib.import_module(module)
+
+def reseed(seed):
+    random.seed(seed)
+    if 'numpy' in sys.modules:
+        sys.modules['numpy'].random.seed(seed)
+
+class Case:
+    def __init__(self, name, setup, nodes=None):
+        self.name = name
+        self.setup = setup
+        self.nodes = nodes or (lambda result: None)
+
+def item(index):
+    return lambda result: result[index]
+
+def grid_graph(size):
+    graph = {}
+    rng = random.Random(size)
+    for r in range(size):
+        for c in range(size):
+            graph[(r, c)] = {}
+    for r in range(size):
+        for c in range(size):
+            for nr, nc in ((r + 1, c), (r, c + 1)):
+                if nr < size and nc < size:
+                    w = rng.randint(1, 9)
+                    graph[(r, c)][(nr, nc)] = w
+                    graph[(nr, nc)][(r, c)] = w
+    return graph
+
+def lab1_cases():
+    nqueens = load('Lab1', 'nqueens')
+    farmer = load('Lab1', 'farmer')
+    state_search = load('Lab1', 'state_search')
+    shortest_path = load('Lab1', 'shortest_path')
+    start, goal, is_goal = farmer.start_code, farmer.goal_code, lambda code: code == farmer.goal_code
+    size = 60
+    source, target = (0, 0), (size - 1, size - 1)
+
+    def dict_graph():
+        graph = grid_graph(size)
+        return lambda: shortest_path.dijkstra(graph, source, target)
+
+    def csr(search):
+        graph = shortest_path.CSRGraph.from_dict(grid_graph(size))
+        workspace = shortest_path.QueryWorkspace(graph)
+        return lambda: search(graph, source, target, workspace=workspace)
+
+    def hierarchy():
+        graph = shortest_path.CSRGraph.from_dict(grid_graph(size))
+        ch = shortest_path.ContractionHierarchy.build(graph)
+        workspace = shortest_path.QueryWorkspace(ch)
+        return lambda: ch.query(source, target, workspace)
+
+    return [
+        Case('Lab1/count_nqueens (n=10)', lambda: partial(nqueens.count_nqueens, 10)),
+        Case('Lab1/farmer bfs', lambda: partial(state_search.bfs, start, farmer.next_codes, is_goal), item(2)),
+        Case('Lab1/farmer bidirectional_bfs',
+             lambda: partial(state_search.bidirectional_bfs, start, goal, farmer.next_codes), item(2)),
+        Case('Lab1/crossing table (8 items)',
+             lambda: partial(farmer.CrossingTable, 8, 2, farmer.FORBIDDEN)),
+        Case(f'Lab1/dijkstra ({size}x{size} grid)', dict_graph),
+        Case(f'Lab1/dijkstra_csr ({size}x{size} grid)', partial(csr, shortest_path.dijkstra_csr)),
+        Case(f'Lab1/bidirectional_dijkstra ({size}x{size} grid)', partial(csr, shortest_path.bidirectional_dijkstra)),
+        Case(f'Lab1/contraction hierarchy query ({size}x{size} grid)', hierarchy),
+    ]
+
+def lab2_cases():
+    lab2 = load('Lab2', 'N_Queens_Uninformed_Search')
+    N = 8
+    return [
+        Case(f'Lab2/DFS (N={N})', lambda: partial(lab2.dfs, N), item(1)),
+        Case(f'Lab2/BFS (N={N})', lambda: partial(lab2.bfs, N), item(1)),
+        Case(f'Lab2/BFS compact (N={N})', lambda: partial(lab2.compact_bfs, N), item(1)),
+        Case(f'Lab2/UCS col+1 (N={N})', lambda: partial(lab2.ucs, N, lab2.cost_col_plus_one), item(2)),
+    ]
+
+def lab3_cases():
+    lab3 = load('Lab3', 'N_Queens_Informed_Search')
+    N = 8
+    return [Case(f'Lab3/{name} (N={N})', partial(partial, algorithm, N), item(2))
+            for name, algorithm in lab3.ALGORITHMS.items()]
+
+def lab4_cases():
+    maze_generator = load('Lab4', 'maze_generator')
+    limited_memory = load('Lab4', 'limited_memory')
+    size = 41
+    maze, start_pos, goal_pos = maze_generator.generate_maze(size, size, seed=0)
+    return [Case(f'Lab4/{name} ({size}x{size} maze)',
+                 partial(partial, algorithm, maze, start_pos, goal_pos, 1000, 30, None), item(1))
+            for name, algorithm in limited_memory.ALGORITHMS.items()]
+
+def lab5_cases():
+    n_queens = load('Lab5', 'n_queens')
+    n = 10
+    return [Case(f'Lab5/{name} (n={n})', partial(partial, solver, n), item(1))
+            for name, solver in n_queens.SOLVERS.items()]
+
+LABS = [lab1_cases, lab2_cases, lab3_cases, lab4_cases, lab5_cases]
+
+# All cases whose name contains pattern; a lab that cannot be imported
+# (e.g. numpy missing for Lab5) is reported and skipped
+def discover(pattern=''):
+    cases = []
+    for lab in LABS:
+        try:
+            cases.extend(lab())
+        except ImportError as e:
+            print(f"Skipping {lab.__name__}: {e}", file=sys.stderr)
+    return [case for case in cases if pattern.lower() in case.name.lower()]
+
+def median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+def measure(case, warmup=1, repeat=5, seed=0):
+    run = case.setup()
+    for _ in range(warmup):
+        reseed(seed)
+        run()
+    wall, cpu = [], []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            reseed(seed)
+            wall_start, cpu_start = time.perf_counter_ns(), time.process_time_ns()
+            result = run()
+            cpu.append(time.process_time_ns() - cpu_start)
+            wall.append(time.perf_counter_ns() - wall_start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    nodes = case.nodes(result)
+
+    # Memory pass, not timed
+    reseed(seed)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    wall_median = median(wall)
+    return {
+        'repeat': repeat,
+        'wall_ns_median': wall_median,
+        'wall_ns_min': min(wall),
+        'cpu_ns_median': median(cpu),
+        'nodes': nodes,
+        'nodes_per_second': nodes / (wall_median / 1e9) if nodes and wall_median else None,
+        'peak_bytes': peak_bytes,
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(pattern='', warmup=1, repeat=5, seed=0):
+    results = {}
+    for case in discover(pattern):
+        result = measure(case, warmup, repeat, seed)
+        results[case.name] = result
+        rate = f"{result['nodes_per_second']:>12,.0f} nodes/s" if result['nodes_per_second'] else ' ' * 20
+        print(f"{case.name:<45} {result['wall_ns_median'] / 1e6:>10.3f} ms  "
+              f"cpu {result['cpu_ns_median'] / 1e6:>10.3f} ms  {rate}  "
+              f"{result['peak_bytes'] / 1024:>10.1f} KB")
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'warmup': warmup,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+# Cases present in both runs whose median wall time changed by more than
+# threshold (as a fraction); returns the names of the regressions
+def compare(baseline, current, threshold=0.1):
+    regressions = []
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'}:")
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            continue
+        ratio = result['wall_ns_median'] / old['wall_ns_median']
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = 'faster'
+        else:
+            status = ''
+        memory = result['peak_bytes'] / old['peak_bytes'] if old['peak_bytes'] else None
+        memory = f"memory x{memory:.2f}" if memory is not None else ''
+        print(f"{name:<45} x{ratio:.2f} time  {memory:<14} {status}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the solvers of all labs.")
+    parser.add_argument('-k', '--filter', default='', help="only cases whose name contains this text")
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="save the results to this JSON file")
+    parser.add_argument('--compare', help="JSON file of an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="relative change in median time flagged by --compare (default 0.1)")
+    parser.add_argument('--list', action='store_true', help="list the cases and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for case in discover(args.filter):
+            print(case.name)
+        return 0
+    current = run_benchmarks(args.filter, args.warmup, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        return 1 if compare(baseline, current, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import heapq
+import time
+from array import array
+
+# Best-first search core shared by UCS, A* and Greedy on N-Queens.
+#
+# Nodes are integer ids into flat arrays (parent, column, cost, depth and the
+# column/diagonal attack masks of the next row), so a partial state is never
+# copied; it is rebuilt from parent ids only for the solution. Heap entries
+# are plain ints, priority << TIE_BITS | (N - depth) << ID_BITS | node id,
+# so ties on priority go to the deepest node, the one closest to a full
+# board, without comparing states; among equally deep nodes the first
+# generated wins. Priorities must be integers and N at most 64 (masks are
+# stored as 'Q').
+
+ID_BITS = 40
+ID_MASK = (1 << ID_BITS) - 1
+TIE_BITS = ID_BITS + 7
+
+def reverse_bits(mask, N):
+    return int(format(mask, f'0{N}b')[::-1], 2) if N else 0
+
+# heuristic(depth, cols, diag1, diag2, parent_data, col) -> (h, data) is
+# called for every generated node; data is kept with the node and handed
+# back as parent_data for its children. use_cost=False orders by h alone
+# (greedy). With transposition=True, a node whose masks were already reached
+# at a lower or equal cost is dropped, since identical masks have identical
+# completions; symmetry=True also merges left-right mirror images, which is
+# only sound when cost_func(c) == cost_func(N - 1 - c). hooks (see
+# search_hooks.py at the repository root) receive expand (frontier size),
+# generate (priority) and prune (cost) events and time cost_func and the
+# heuristic.
+def best_first_search(N, cost_func, heuristic=None, use_cost=True, transposition=False, symmetry=False,
+                      hooks=None):
+    if hooks is not None:
+        cost_func = hooks.timed('cost', cost_func)
+        if heuristic:
+            heuristic = hooks.timed('heuristic', heuristic)
+    full = (1 << N) - 1
+    parent = array('q', [-1])
+    column = array('h', [-1])
+    cost = array('q', [0])
+    depth = array('h', [0])
+    cols = array('Q', [0])
+    diag1 = array('Q', [0])
+    diag2 = array('Q', [0])
+    h, data = heuristic(0, 0, 0, 0, None, None) if heuristic else (0, None)
+    node_data = [data]
+    table = {} if transposition else None
+    pq = [h << TIE_BITS | N << ID_BITS]
+    explored = 0
+    start_time = time.process_time()
+    while pq:
+        node = heapq.heappop(pq) & ID_MASK
+        explored += 1
+        if hooks is not None:
+            hooks.emit('expand', len(pq))
+        if depth[node] == N:
+            total_cost = cost[node]
+            state = []
+            while parent[node] >= 0:
+                state.append(column[node])
+                node = parent[node]
+            state.reverse()
+            end_time = time.process_time()
+            return state, total_cost, explored, end_time - start_time
+        c, d1, d2 = cols[node], diag1[node], diag2[node]
+        g = cost[node]
+        child_depth = depth[node] + 1
+        free = full & ~(c | d1 | d2)
+        for col in range(N):
+            if free >> col & 1:
+                bit = 1 << col
+                new_cols = c | bit
+                new_diag1 = ((d1 | bit) << 1) & full
+                new_diag2 = (d2 | bit) >> 1
+                new_cost = g + cost_func(col)
+                if table is not None:
+                    key = (child_depth, new_cols, new_diag1, new_diag2)
+                    if symmetry:
+                        key = min(key, (child_depth, reverse_bits(new_cols, N),
+                                        reverse_bits(new_diag2, N), reverse_bits(new_diag1, N)))
+                    if table.get(key, new_cost + 1) <= new_cost:
+                        if hooks is not None:
+                            hooks.emit('prune', new_cost)
+                        continue
+                    table[key] = new_cost
+                h, data = heuristic(child_depth, new_cols, new_diag1, new_diag2, node_data[node], col) \
+                    if heuristic else (0, None)
+                child = len(parent)
+                parent.append(node)
+                column.append(col)
+                cost.append(new_cost)
+                depth.append(child_depth)
+                cols.append(new_cols)
+                diag1.append(new_diag1)
+                diag2.append(new_diag2)
+                node_data.append(data)
+                priority = new_cost + h if use_cost else h
+                heapq.heappush(pq, priority << TIE_BITS | (N - child_depth) << ID_BITS | child)
+                if hooks is not None:
+                    hooks.emit('generate', priority)
+    end_time = time.process_time()
+    return None, None, explored, end_time - start_time
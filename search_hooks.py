@@ -0,0 +1,85 @@
+import math
+import time
+from array import array
+
+# Instrumentation hooks for the lab solvers.
+#
+# Solvers that support it take hooks=None. A hooks object is duck-typed and
+# needs two methods:
+#   emit(event, value)  called at 'expand', 'generate', 'prune' and 'restart'
+#                       points, with a number describing the event (frontier
+#                       size, priority, conflicts, new bound, ...)
+#   timed(phase, func)  returns func wrapped so that each call is timed as
+#                       that phase
+# Solvers call timed() once, before their main loop, on the functions whose
+# cost is of interest (heuristics, is_safe, conflict counting) and guard
+# every emit with "if hooks is not None", so without hooks a run pays one
+# test per event and nothing per timed call.
+
+EXPAND = 'expand'
+GENERATE = 'generate'
+PRUNE = 'prune'
+RESTART = 'restart'
+EVENTS = (EXPAND, GENERATE, PRUNE, RESTART)
+
+# Collector for time-series traces and per-phase timing histograms.
+# Event counts are exact; with sample_every=k only every k-th event of each
+# kind goes into the time series. Phase durations are bucketed by powers of
+# two of nanoseconds (bucket b holds durations in [2**(b-1), 2**b)).
+class SearchTrace:
+    def __init__(self, sample_every=1, clock=time.perf_counter_ns):
+        self.sample_every = sample_every
+        self.clock = clock
+        self.start = clock()
+        self.counts = dict.fromkeys(EVENTS, 0)
+        self.times = {}
+        self.values = {}
+        self.phases = {}
+
+    def emit(self, event, value=None):
+        count = self.counts.get(event, 0)
+        self.counts[event] = count + 1
+        if count % self.sample_every:
+            return
+        if event not in self.times:
+            self.times[event] = array('q')
+            self.values[event] = array('d')
+        self.times[event].append(self.clock() - self.start)
+        self.values[event].append(math.nan if value is None else value)
+
+    def timed(self, phase, func):
+        stats = self.phases.setdefault(phase, [0, 0, array('q', bytes(8 * 64))])
+        histogram = stats[2]
+        clock = self.clock
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = func(*args, **kwargs)
+            elapsed = clock() - start
+            stats[0] += 1
+            stats[1] += elapsed
+            histogram[elapsed.bit_length()] += 1
+            return result
+        return wrapper
+
+    # (ns since the trace started, value) of the sampled events of one kind
+    def series(self, event):
+        return list(self.times.get(event, ())), list(self.values.get(event, ()))
+
+    # (low_ns, high_ns, calls) for the non-empty buckets of one phase
+    def histogram(self, phase):
+        buckets = self.phases[phase][2]
+        return [(1 << (b - 1) if b else 0, (1 << b) - 1, calls) for b, calls in enumerate(buckets) if calls]
+
+    def report(self):
+        elapsed = (self.clock() - self.start) / 1e9
+        print(f"Trace over {elapsed:.3f} s")
+        for event, count in self.counts.items():
+            if count:
+                print(f"  {event:<10} {count:>12,} events  {count / elapsed if elapsed else 0:>14,.0f}/s")
+        for phase, (calls, total, _) in self.phases.items():
+            if not calls:
+                continue
+            print(f"  phase {phase}: {calls:,} calls, {total / 1e6:.3f} ms total, {total / calls / 1e3:.2f} us mean")
+            for low, high, count in self.histogram(phase):
+                print(f"    {low:>10}-{high:<10} ns  {count:>10,}")